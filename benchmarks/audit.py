@@ -0,0 +1,88 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Batch audit benchmark
+
+Reports the time to audit many accounts by calling the methods of each
+principal and with ``audit.audit()``, inline and on a process pool. Needs the
+``test`` extra.
+
+  $ python benchmarks/audit.py
+"""
+import concurrent.futures
+import datetime
+import os
+import time
+
+import zope.component
+from zope.password.interfaces import IPasswordManager
+from zope.password.password import PlainTextPasswordManager
+from zope.pluggableauth.plugins import principalfolder
+
+from z3c.password import audit
+from z3c.password import interfaces
+from z3c.password import password
+from z3c.password import principal
+
+
+ACCOUNTS = 100000
+
+
+class Principal(principal.PrincipalMixIn, principalfolder.InternalPrincipal):
+    pass
+
+
+def methods(principals):
+    for user in principals:
+        user.passwordExpiresOn()
+        user.tooManyLoginFailures()
+        user.accountLocked()
+
+
+def main():
+    zope.component.provideUtility(
+        PlainTextPasswordManager(), IPasswordManager, name='Plain Text')
+    zope.component.provideUtility(
+        password.PasswordOptionsUtility(
+            passwordExpiresAfter=30, lockOutPeriod=10, maxFailedAttempts=3),
+        interfaces.IPasswordOptionsUtility)
+    now = datetime.datetime.now()
+    principals = []
+    for idx in range(ACCOUNTS):
+        user = Principal('user%i' % idx, 'secret', 'User',
+                         passwordManagerName='Plain Text')
+        user.passwordSetOn = now - datetime.timedelta(days=idx % 60)
+        user.failedAttempts = idx % 5
+        user.lastFailedAttempt = now
+        principals.append(user)
+    states = [audit.AccountState(
+        user.login, user.passwordSetOn, False, user.failedAttempts,
+        user.lastFailedAttempt) for user in principals]
+
+    executor = concurrent.futures.ProcessPoolExecutor(os.cpu_count())
+    print('{:<28} {:>10}'.format('%i accounts' % ACCOUNTS, 'msec'))
+    for name, func in (
+            ('principal methods', lambda: methods(principals)),
+            ('audit principals', lambda: list(audit.audit(principals))),
+            ('audit records', lambda: list(audit.audit(states))),
+            ('audit records, processes', lambda: list(audit.audit(
+                states, chunkSize=10000, executor=executor)))):
+        start = time.perf_counter()
+        func()
+        print('{:<28} {:>10.1f}'.format(
+            name, (time.perf_counter() - start) * 1e3))
+    executor.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Password blocklist benchmark
+
+Reports the time to build a blocklist file of generated passwords, to open
+it and to check passwords against it.
+
+  $ python benchmarks/blocklist.py [entries]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from z3c.password import blocklist
+
+
+def main(entries=2000000, checks=100000):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'blocklist.bin')
+        lines = ('password%i' % idx for idx in range(entries))
+        start = time.perf_counter()
+        blocklist.build(lines, path, tempdir=tmpdir)
+        built = time.perf_counter()
+        common = blocklist.Blocklist(path)
+        opened = time.perf_counter()
+        for idx in range(checks):
+            'password%i' % (idx * 7) in common
+        checked = time.perf_counter()
+        common.close()
+
+    print('{:<24} {:>12}'.format('%i entries' % entries, 'time'))
+    print('{:<24} {:>10.1f} s'.format('build', built - start))
+    print('{:<24} {:>9.1f} us'.format('open', (opened - built) * 1e6))
+    print('{:<24} {:>9.1f} us'.format(
+        'check', (checked - opened) / checks * 1e6))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
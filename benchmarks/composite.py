@@ -0,0 +1,83 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Composite password utility benchmark
+
+Checks a mix of passwords with a composite of a similarity rule, a
+blocklist and the character rules, declared in the order of the worst
+case. Compares the declared order with the order by the measured costs.
+
+  $ python benchmarks/composite.py
+"""
+import os
+import random
+import tempfile
+import timeit
+
+from z3c.password import blocklist
+from z3c.password import composite
+from z3c.password import password
+
+
+def workload(rnd, count=1000):
+    """Pairs of new and old passwords, most of them violating a rule."""
+    pairs = []
+    for idx in range(count):
+        old = 'old%iPassword!' % idx
+        kind = rnd.random()
+        if kind < 0.6:
+            new = 'short%i' % idx
+        elif kind < 0.8:
+            new = 'password%i' % idx
+        else:
+            new = 'Ok%i#%s' % (idx, rnd.choice('abcdefgh') * 2)
+        pairs.append((new, old))
+    return pairs
+
+
+def main(entries=200000):
+    rnd = random.Random(42)
+    pairs = workload(rnd)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'blocklist.bin')
+        blocklist.build(
+            ('password%i' % idx for idx in range(entries)), path)
+        rules = [
+            password.HighSecurityPasswordUtility(
+                minLength=None, maxLength=None, groupMax=None,
+                maxSimilarity=0.6),
+            blocklist.BlocklistPasswordUtility(
+                password.TrivialPasswordUtility(), path),
+            password.HighSecurityPasswordUtility(
+                minLength=8, maxLength=16, maxSimilarity=None,
+                minDigits=1, minSpecials=1),
+        ]
+
+        print('{:<12} {:>12} {:>12}'.format('order', 'usec/check', 'order'))
+        for label, interval in (('declared', 10 ** 9), ('measured', 100)):
+            utility = composite.CompositePasswordUtility(rules)
+            utility.reorderInterval = interval
+            # warm up, measuring the costs
+            for new, old in pairs:
+                utility.check(new, old)
+            number = 5
+            elapsed = timeit.timeit(
+                lambda: [utility.check(new, old) for new, old in pairs],
+                number=number)
+            print('{:<12} {:>12.2f} {:>12}'.format(
+                label, elapsed / number / len(pairs) * 1e6,
+                str(utility.costs.order)))
+
+
+if __name__ == '__main__':
+    main()
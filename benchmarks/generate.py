@@ -0,0 +1,130 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Password generation benchmark
+
+Compares the constructive ``HighSecurityPasswordUtility.generate()`` with
+the random draw and verify loop it replaced, reporting the verifications
+needed per password and the latency of each. Also compares calling
+``generate()`` repeatedly with ``generateMany()``, and the seeded random
+numbers with ``random.SystemRandom`` and the buffered ``SecureRandom``.
+
+  $ python benchmarks/generate.py [rounds]
+"""
+import random
+import sys
+import time
+
+from z3c.password import interfaces
+from z3c.password import password
+from z3c.password import securerandom
+
+
+# Give up on the old loop after this many candidates.
+MAX_ITERATIONS = 100000
+
+POLICIES = {
+    'default': dict(),
+    'digits': dict(minDigits=4),
+    'strict': dict(minLength=10, maxLength=12, groupMax=4, minDigits=3,
+                   minSpecials=3, minUniqueLetters=4),
+    'tight': dict(minLength=12, maxLength=12, groupMax=3, minLowerLetter=3,
+                  minUpperLetter=3, minDigits=3, minSpecials=3,
+                  minUniqueCharacters=12),
+}
+
+
+class CountingUtility(password.HighSecurityPasswordUtility):
+    """Counts the password checks, by ``verify()`` or ``check()``."""
+
+    verified = 0
+
+    def check(self, new, ref=None):
+        self.verified += 1
+        return super().check(new, ref)
+
+
+def loopGenerate(utility, ref=None):
+    """The draw and verify loop used before the constructive generator."""
+    chars = (utility.LOWERLETTERS + utility.UPPERLETTERS +
+             utility.DIGITS + utility.SPECIALS)
+    for count in range(MAX_ITERATIONS):
+        length = utility.random.randint(utility.minLength, utility.maxLength)
+        new = ''
+        for idx in range(length):
+            new += utility.random.choice(chars)
+        try:
+            utility.verify(new, ref)
+        except interfaces.InvalidPassword:
+            continue
+        return new
+    return None
+
+
+def measure(generate, utility, rounds):
+    utility.verified = 0
+    failed = 0
+    start = time.perf_counter()
+    for count in range(rounds):
+        if generate(utility) is None:
+            failed += 1
+    elapsed = time.perf_counter() - start
+    return utility.verified / rounds, elapsed / rounds * 1e6, failed
+
+
+def main(rounds=200):
+    print('{:<8} {:<12} {:>12} {:>14} {:>8}'.format(
+        'policy', 'generator', 'verify/pwd', 'usec/pwd', 'gave up'))
+    for name, policy in POLICIES.items():
+        utility = CountingUtility(seed=42, **policy)
+        for label, generate in (
+                ('loop', loopGenerate),
+                ('constructive', CountingUtility.generate)):
+            iterations, latency, failed = measure(generate, utility, rounds)
+            print('{:<8} {:<12} {:>12.1f} {:>14.1f} {:>8}'.format(
+                name, label, iterations, latency, failed))
+
+    print()
+    print('{:<8} {:>14} {:>14}'.format(
+        'policy', 'generate()', 'generateMany()'))
+    for name, policy in POLICIES.items():
+        utility = password.HighSecurityPasswordUtility(seed=42, **policy)
+        start = time.perf_counter()
+        for count in range(rounds):
+            utility.generate()
+        single = time.perf_counter() - start
+        start = time.perf_counter()
+        for new in utility.generateMany(rounds):
+            pass
+        bulk = time.perf_counter() - start
+        print('{:<8} {:>14.1f} {:>14.1f}'.format(
+            name, single / rounds * 1e6, bulk / rounds * 1e6))
+
+    print()
+    print('{:<8} {:<14} {:>14}'.format('policy', 'random', 'usec/pwd'))
+    for name, policy in POLICIES.items():
+        utility = password.HighSecurityPasswordUtility(**policy)
+        for label, rnd in (('seeded', random.Random(42)),
+                           ('SystemRandom', random.SystemRandom()),
+                           ('SecureRandom', securerandom.SecureRandom())):
+            utility.random = rnd
+            start = time.perf_counter()
+            for new in utility.generateMany(rounds):
+                pass
+            elapsed = time.perf_counter() - start
+            print('{:<8} {:<14} {:>14.1f}'.format(
+                name, label, elapsed / rounds * 1e6))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
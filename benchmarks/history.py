@@ -0,0 +1,85 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Previous password check benchmark
+
+Reports the time of a password change for a principal with a long password
+history and a slow, salted password hash, with an unbounded history, a
+``passwordHistoryLength`` and a thread pool. Needs the ``test`` extra.
+
+  $ python benchmarks/history.py
+"""
+import concurrent.futures
+import hashlib
+import os
+import time
+
+import zope.component
+from zope.password.interfaces import IPasswordManager
+from zope.pluggableauth.plugins import principalfolder
+
+from z3c.password import principal
+
+
+HISTORY = 100
+ITERATIONS = 20000
+
+
+class PBKDF2PasswordManager:
+    """A slow, salted password hash, releasing the GIL while hashing."""
+
+    def __init__(self, iterations=ITERATIONS):
+        self.iterations = iterations
+
+    def encodePassword(self, password, salt=None):
+        if salt is None:
+            salt = os.urandom(16)
+        digest = hashlib.pbkdf2_hmac(
+            'sha256', password.encode('utf-8'), salt, self.iterations)
+        return salt + digest
+
+    def checkPassword(self, encoded_password, password):
+        return encoded_password == self.encodePassword(
+            password, encoded_password[:16])
+
+
+class Principal(principal.PrincipalMixIn, principalfolder.InternalPrincipal):
+    pass
+
+
+def main():
+    zope.component.provideUtility(
+        PBKDF2PasswordManager(), IPasswordManager, name='PBKDF2')
+    user = Principal('user', 'secret', 'User', passwordManagerName='PBKDF2')
+    user.disallowPasswordReuse = True
+    for count in range(HISTORY):
+        user.setPassword('password%i' % count)
+
+    executor = concurrent.futures.ThreadPoolExecutor(os.cpu_count())
+    print('{:<24} {:>10}'.format('history', 'msec'))
+    for name, length, pool in (
+            ('unbounded', None, None),
+            ('unbounded, thread pool', None, executor),
+            ('length 10', 10, None),
+            ('length 10, thread pool', 10, executor)):
+        user.passwordHistoryLength = length
+        user.passwordHistoryExecutor = pool
+        start = time.perf_counter()
+        user._checkDisallowedPreviousPassword('new password')
+        print('{:<24} {:>10.1f}'.format(
+            name, (time.perf_counter() - start) * 1e3))
+    executor.shutdown()
+
+
+if __name__ == '__main__':
+    main()
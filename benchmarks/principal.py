@@ -0,0 +1,171 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""``PrincipalMixIn.checkPassword`` microbenchmark
+
+Reports the utility lookups and the time per ``checkPassword()`` call in
+the success, failure, locked and expired branches. The lookups include the
+one of the password manager done by the principal folder. The ``stored``
+branch records the failures in a ``MemoryLoginFailureStore`` instead of the
+principal, the ``monitored`` branch is the success branch recorded by a
+``PasswordMonitor``, the ``fastReject`` branch is the locked branch with
+``fastRejectLocked``. Needs the ``test`` extra.
+
+  $ python benchmarks/principal.py
+"""
+import datetime
+import timeit
+
+import zope.component
+from zope.component.globalregistry import BaseGlobalComponents
+from zope.password.interfaces import IPasswordManager
+from zope.password.password import PlainTextPasswordManager
+from zope.pluggableauth.plugins import principalfolder
+
+from z3c.password import interfaces
+from z3c.password import loginfailures
+from z3c.password import monitor
+from z3c.password import password
+from z3c.password import principal
+
+
+NOW = datetime.datetime(2026, 1, 1, 12, 0)
+
+
+class CountingComponents(BaseGlobalComponents):
+    """Counts the utility lookups."""
+
+    lookups = 0
+
+    def queryUtility(self, provided, name='', default=None):
+        self.lookups += 1
+        return super().queryUtility(provided, name, default)
+
+
+class Principal(principal.PrincipalMixIn, principalfolder.InternalPrincipal):
+
+    def now(self):
+        return NOW
+
+
+def setUp():
+    registry = CountingComponents('benchmark')
+    registry.registerUtility(
+        PlainTextPasswordManager(), IPasswordManager, name='Plain Text')
+    registry.registerUtility(
+        password.PasswordOptionsUtility(
+            passwordExpiresAfter=90, lockOutPeriod=30, maxFailedAttempts=5),
+        interfaces.IPasswordOptionsUtility)
+    registry.registerUtility(
+        loginfailures.MemoryLoginFailureStore(),
+        interfaces.ILoginFailureStore, name='memory')
+    registry.registerUtility(
+        monitor.PasswordMonitor(), interfaces.IPasswordMonitor,
+        name='monitor')
+    zope.component.getSiteManager.sethook(lambda context=None: registry)
+    return registry
+
+
+def scenarios():
+    def success():
+        user = Principal('user', 'secret', 'User',
+                         passwordManagerName='Plain Text')
+        return lambda: user.checkPassword('secret')
+
+    def failure():
+        user = Principal('user', 'secret', 'User',
+                         passwordManagerName='Plain Text')
+
+        def check():
+            user.failedAttempts = 0
+            user.checkPassword('wrong')
+        return check
+
+    def stored():
+        user = Principal('user', 'secret', 'User',
+                         passwordManagerName='Plain Text')
+        user.loginFailureStoreName = 'memory'
+
+        def check():
+            user.checkPassword('wrong')
+            user.checkPassword('secret')
+        return check
+
+    def monitored():
+        user = Principal('user', 'secret', 'User',
+                         passwordManagerName='Plain Text')
+        user.passwordMonitorName = 'monitor'
+        return lambda: user.checkPassword('secret')
+
+    def locked():
+        user = Principal('user', 'secret', 'User',
+                         passwordManagerName='Plain Text')
+        user.failedAttempts = 5
+        user.lastFailedAttempt = NOW
+
+        def check():
+            try:
+                user.checkPassword('secret')
+            except interfaces.AccountLocked:
+                pass
+        return check
+
+    def fastReject():
+        user = Principal('user', 'secret', 'User',
+                         passwordManagerName='Plain Text')
+        user.failedAttempts = 5
+        user.lastFailedAttempt = NOW
+        user.fastRejectLocked = True
+
+        def check():
+            try:
+                user.checkPassword('secret')
+            except interfaces.AccountLocked:
+                pass
+        return check
+
+    def expired():
+        user = Principal('user', 'secret', 'User',
+                         passwordManagerName='Plain Text')
+        user.passwordSetOn = NOW - datetime.timedelta(days=91)
+
+        def check():
+            try:
+                user.checkPassword('secret')
+            except interfaces.PasswordExpired:
+                pass
+        return check
+
+    return {'success': success, 'failure': failure, 'stored': stored,
+            'monitored': monitored, 'locked': locked,
+            'fastReject': fastReject, 'expired': expired}
+
+
+def main(number=20000):
+    registry = setUp()
+    try:
+        print('{:<10} {:>10} {:>12}'.format('branch', 'lookups', 'usec/call'))
+        for name, factory in scenarios().items():
+            check = factory()
+            registry.lookups = 0
+            check()
+            lookups = registry.lookups
+            elapsed = timeit.timeit(check, number=number)
+            print('{:<10} {:>10} {:>12.2f}'.format(
+                name, lookups, elapsed / number * 1e6))
+    finally:
+        zope.component.getSiteManager.reset()
+
+
+if __name__ == '__main__':
+    main()
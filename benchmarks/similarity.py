@@ -0,0 +1,69 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Password similarity benchmark
+
+Compares the plain ``difflib.SequenceMatcher.ratio()`` with the similarity
+components for password pairs of growing length, with the default
+``maxSimilarity`` of 0.6.
+
+  $ python benchmarks/similarity.py
+"""
+import difflib
+import random
+import string
+import timeit
+
+from z3c.password import similarity
+
+
+MAX_SIMILARITY = 0.6
+LENGTHS = (12, 64, 256, 1024, 4096)
+
+
+def pairs(length, rnd):
+    chars = string.ascii_letters + string.digits + string.punctuation
+    ref = ''.join(rnd.choice(chars) for count in range(length))
+    different = ''.join(rnd.choice(chars) for count in range(length))
+    similar = list(ref)
+    for count in range(length // 10 or 1):
+        similar[rnd.randrange(length)] = rnd.choice(chars)
+    return {'different': (different, ref), 'similar': (''.join(similar), ref)}
+
+
+def plainRatio(new, ref, maxSimilarity):
+    return difflib.SequenceMatcher(None, new, ref).ratio()
+
+
+def main():
+    rnd = random.Random(42)
+    engines = (
+        ('difflib', plainRatio),
+        ('DifflibSimilarity', similarity.DifflibSimilarity().ratio),
+        ('BoundedSimilarity', similarity.BoundedSimilarity().ratio),
+    )
+    print('{:>6} {:<10} {:<18} {:>12} {:>8}'.format(
+        'length', 'pair', 'engine', 'usec/check', 'ratio'))
+    for length in LENGTHS:
+        for kind, (new, ref) in pairs(length, rnd).items():
+            for name, ratio in engines:
+                number = max(10, 20000 // length)
+                elapsed = timeit.timeit(
+                    lambda: ratio(new, ref, MAX_SIMILARITY), number=number)
+                print('{:>6} {:<10} {:<18} {:>12.1f} {:>8.3f}'.format(
+                    length, kind, name, elapsed / number * 1e6,
+                    ratio(new, ref, MAX_SIMILARITY)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Password strength benchmark
+
+Reports the time to compile the strength tables on first use, to estimate
+the strength of passwords of growing length and to verify a password with
+and without ``minEntropyBits``, compared with one password hash as done by
+each login.
+
+  $ python benchmarks/strength.py
+"""
+import random
+import string
+import time
+import timeit
+
+from history import PBKDF2PasswordManager
+
+from z3c.password import password
+from z3c.password import strength
+
+
+LENGTHS = (8, 12, 16, 32, 64)
+
+
+def usec(func, number):
+    return timeit.timeit(func, number=number) / number * 1e6
+
+
+def samples(rnd):
+    """Passwords made of patterns, random ones of growing length and the
+    worst cases of the longest password searched for patterns."""
+    chars = string.ascii_letters + string.digits + string.punctuation
+    result = {
+        'word': 'Password1!',
+        'walk': 'qwerty%$#@!',
+        'repeat': 'abcabc' * 4,
+        # worst cases, patterns everywhere
+        'worst-walk': 'as' * 50,
+        'worst-row': 'asdfghjkl;' * 10,
+        'worst-sequence': (string.ascii_lowercase * 4)[:100],
+        'worst-word': 'a' * 100,
+    }
+    for length in LENGTHS:
+        result['random-%i' % length] = ''.join(
+            rnd.choice(chars) for count in range(length))
+    return result
+
+
+def main():
+    start = time.perf_counter()
+    strength.defaultTables()
+    compiled = time.perf_counter() - start
+
+    print('{:<28} {:>12}'.format('stage', 'usec'))
+    print('{:<28} {:>12.1f}'.format('compile tables', compiled * 1e6))
+    estimator = strength.PatternStrength()
+    passwords = samples(random.Random(42))
+    for name, new in passwords.items():
+        print('{:<28} {:>12.1f}'.format(
+            'entropy %s' % name, usec(lambda: estimator.entropy(new), 2000)))
+
+    plain = password.HighSecurityPasswordUtility(groupMax=8)
+    strong = password.HighSecurityPasswordUtility(
+        groupMax=8, minEntropyBits=30)
+    new = passwords['random-12']
+    print('{:<28} {:>12.1f}'.format(
+        'verify', usec(lambda: plain.verify(new), 2000)))
+    print('{:<28} {:>12.1f}'.format(
+        'verify minEntropyBits', usec(lambda: strong.verify(new), 2000)))
+
+    manager = PBKDF2PasswordManager()
+    encoded = manager.encodePassword(new)
+    print('{:<28} {:>12.1f}'.format(
+        'PBKDF2 hash check', usec(
+            lambda: manager.checkPassword(encoded, new), 20)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""pyperf benchmark suite of the hot paths
+
+Covers ``checkPassword()`` in all its branches, ``verify()`` across
+password lengths and policies, ``generate()`` under strict policies, the
+similarity check, the strength estimation and the previous password check
+with a growing history.
+Needs the ``benchmark`` extra. See ``benchmarks/README.rst``.
+
+  $ python benchmarks/suite.py -o result.json
+  $ python -m pyperf compare_to benchmarks/baselines/suite.json result.json
+"""
+import random
+
+import generate
+import history
+import principal
+import pyperf
+import similarity
+import strength
+from zope.password.interfaces import IPasswordManager
+
+from z3c.password import password
+
+
+VERIFY_LENGTHS = (12, 64, 256)
+UNICODE_PASSWORDS = {
+    'latin': 'Ñandú-Straße',
+    'cyrillic': 'Пароль-Ключ12',
+    'cjk': '密码パスワード12!',
+}
+SIMILARITY_LENGTHS = (12, 64, 256)
+HISTORY_LENGTHS = (1, 10, 100)
+
+
+def passwordOfLength(utility, length):
+    # A generated password contains all the characters the policy requires,
+    # so repeating it keeps it valid without length and group limits.
+    new = utility.generate()
+    return (new * (length // len(new) + 1))[:length]
+
+
+def benchCheckPassword(runner):
+    for name, factory in principal.scenarios().items():
+        runner.bench_func('checkPassword-%s' % name, factory())
+
+
+def benchVerify(runner):
+    for name, policy in generate.POLICIES.items():
+        generator = password.HighSecurityPasswordUtility(seed=42, **policy)
+        policy = dict(policy, minLength=None, maxLength=None, groupMax=None)
+        utility = password.HighSecurityPasswordUtility(seed=42, **policy)
+        for length in VERIFY_LENGTHS:
+            new = passwordOfLength(generator, length)
+            runner.bench_func(
+                'verify-%s-%i' % (name, length), utility.verify, new)
+
+
+def benchVerifyUnicode(runner):
+    for groups in (False, True):
+        utility = password.HighSecurityPasswordUtility(
+            minLength=None, maxLength=None, groupMax=None,
+            unicodeGroups=groups)
+        for name, new in UNICODE_PASSWORDS.items():
+            runner.bench_func(
+                'verify-%s-%s' % ('unicode' if groups else 'ascii', name),
+                utility.verify, new)
+
+
+def benchGenerate(runner):
+    for name in ('strict', 'tight'):
+        utility = password.HighSecurityPasswordUtility(
+            seed=42, **generate.POLICIES[name])
+        runner.bench_func('generate-%s' % name, utility.generate)
+    # Without a seed the passwords are drawn from the secure random numbers.
+    utility = password.HighSecurityPasswordUtility(
+        **generate.POLICIES['tight'])
+    runner.bench_func('generate-secure', utility.generate)
+
+
+def benchSimilarity(runner):
+    rnd = random.Random(42)
+    utility = password.HighSecurityPasswordUtility(seed=42)
+    for length in SIMILARITY_LENGTHS:
+        for kind, (new, ref) in similarity.pairs(length, rnd).items():
+            runner.bench_func(
+                'similarity-%s-%i' % (kind, length),
+                utility._checkSimilarity, new, ref)
+
+
+def benchStrength(runner):
+    estimator = password.HighSecurityPasswordUtility.strength
+    estimator.tables  # compiled before measuring
+    for name, new in strength.samples(random.Random(42)).items():
+        runner.bench_func('strength-%s' % name, estimator.entropy, new)
+
+
+def benchHistory(runner, registry):
+    registry.registerUtility(
+        history.PBKDF2PasswordManager(iterations=1000),
+        IPasswordManager, name='PBKDF2')
+    user = history.Principal(
+        'user', 'secret', 'User', passwordManagerName='PBKDF2')
+    user.disallowPasswordReuse = True
+    for count in range(max(HISTORY_LENGTHS)):
+        user.setPassword('password%i' % count)
+    for length in HISTORY_LENGTHS:
+        checker = history.Principal(
+            'user', 'secret', 'User', passwordManagerName='PBKDF2')
+        checker.disallowPasswordReuse = True
+        checker.passwordHistoryLength = length
+        checker.previousPasswords = user.previousPasswords
+        runner.bench_func(
+            'history-%i' % length,
+            checker._checkDisallowedPreviousPassword, 'new password')
+
+
+def main():
+    runner = pyperf.Runner()
+    runner.metadata['description'] = 'z3c.password hot paths'
+    registry = principal.setUp()
+    benchCheckPassword(runner)
+    benchVerify(runner)
+    benchVerifyUnicode(runner)
+    benchGenerate(runner)
+    benchSimilarity(runner)
+    benchStrength(runner)
+    benchHistory(runner, registry)
+
+
+if __name__ == '__main__':
+    main()
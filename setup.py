@@ -56,9 +56,12 @@ setup(
     include_package_data=True,
     python_requires='>=3.9',
     extras_require=dict(
+        benchmark=[
+            'pyperf',
+            'zope.pluggableauth',
+        ],
         test=[
             'z3c.coverage',
-            'zope.password',
             'zope.pluggableauth',
             'zope.testing',
         ],
@@ -66,10 +69,12 @@ setup(
     install_requires=[
         'setuptools',
         'zope.component',
+        'zope.event',
         'zope.exceptions',
         'zope.i18nmessageid',
         'zope.i18n',
         'zope.interface',
+        'zope.password',
         'zope.schema',
         'zope.security',
     ],
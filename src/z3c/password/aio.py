@@ -0,0 +1,91 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""asyncio Support
+"""
+import asyncio
+import functools
+
+from z3c.password.password import checkWith
+from z3c.password.password import generateManyWith
+from z3c.password.password import verifyAllWith
+
+
+class AsyncPasswordUtility:
+    """Run the methods of a password utility without blocking the event loop.
+
+    The work is done by the ``executor``, the default executor of the event
+    loop if ``None``. At most ``maxConcurrency`` calls run at the same time,
+    the other ones wait without blocking; there is no limit if ``None``.
+
+    Note that the calls run in other threads, which do not see the local
+    component site and the interaction of the calling thread. Password
+    utilities implementing only ``verify()`` and ``generate()`` are
+    supported like by ``password.checkWith()``.
+    """
+
+    def __init__(self, utility, executor=None, maxConcurrency=None):
+        self.utility = utility
+        self.executor = executor
+        self.maxConcurrency = maxConcurrency
+        # created on first use, within the running event loop
+        self._semaphore = None
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        call = functools.partial(func, *args)
+        if self.maxConcurrency is None:
+            return await loop.run_in_executor(self.executor, call)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.maxConcurrency)
+        async with self._semaphore:
+            return await loop.run_in_executor(self.executor, call)
+
+    async def averify(self, new, ref=None):
+        """See ``IPasswordUtility.verify()``."""
+        return await self._run(self.utility.verify, new, ref)
+
+    async def acheck(self, new, ref=None):
+        """See ``IPasswordUtility.check()``."""
+        return await self._run(checkWith, self.utility, new, ref)
+
+    async def averifyAll(self, new, ref=None):
+        """See ``IPasswordUtility.verifyAll()``."""
+        return await self._run(verifyAllWith, self.utility, new, ref)
+
+    async def agenerate(self, ref=None):
+        """See ``IPasswordUtility.generate()``."""
+        return await self._run(self.utility.generate, ref)
+
+    async def agenerateMany(self, n, refs=None):
+        """See ``IPasswordUtility.generateMany()``.
+
+        Returns a list, generated by one call of the executor.
+        """
+        return await self._run(
+            lambda: list(generateManyWith(self.utility, n, refs)))
+
+    async def acheckDisallowedPreviousPassword(self, principal, password):
+        """Check that the password of the ``PrincipalMixIn`` principal was
+        not used before, raising ``PreviousPasswordNotAllowed`` otherwise.
+
+        The options of the principal are resolved in the calling thread, so
+        that a local options utility is found.
+        """
+        options = principal._passwordOptions()
+        held = principal._holdPasswordOptions(options)
+        try:
+            return await self._run(
+                principal._checkDisallowedPreviousPassword, password)
+        finally:
+            principal._releasePasswordOptions(held)
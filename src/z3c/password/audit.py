@@ -0,0 +1,193 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Batch Audit of Accounts
+"""
+import collections
+import datetime
+import itertools
+
+import zope.component
+
+from z3c.password import interfaces
+
+
+# The password state of an account. The options are overrides of the
+# options utility named ``optionsName``, like the attributes of the
+# principal mix-in.
+AccountState = collections.namedtuple(
+    'AccountState',
+    ('key', 'passwordSetOn', 'passwordExpired', 'failedAttempts',
+     'lastFailedAttempt', 'passwordExpiresAfter', 'lockOutPeriod',
+     'maxFailedAttempts', 'optionsName'),
+    defaults=(None, False, 0, None, None, None, None, None))
+
+# The options of an options utility, with the periods as time deltas.
+AuditOptions = collections.namedtuple(
+    'AuditOptions',
+    ('passwordExpiresAfter', 'lockOutPeriod', 'maxFailedAttempts',
+     'failureWindow'),
+    defaults=(None, None, None, None))
+
+# The audit of an account:
+# - expiresOn: when the password expires, ``None`` if never,
+# - expired: the password expired or has to be changed on next login,
+# - forced: the password has to be changed on next login,
+# - tooManyFailures: the maximum amount of failed logins is reached,
+# - locked: too many failures, within the lockout period if there is one.
+AuditResult = collections.namedtuple(
+    'AuditResult',
+    ('key', 'expiresOn', 'expired', 'forced', 'tooManyFailures', 'locked'))
+
+
+def optionsOf(utility):
+    """Return the ``AuditOptions`` of an options utility, which may be
+    ``None``."""
+    if utility is None:
+        return AuditOptions()
+    expiresAfter = lockOutPeriod = failureWindow = None
+    if utility.passwordExpiresAfter is not None:
+        expiresAfter = datetime.timedelta(days=utility.passwordExpiresAfter)
+    if utility.lockOutPeriod is not None:
+        lockOutPeriod = datetime.timedelta(minutes=utility.lockOutPeriod)
+    if utility.failureWindow is not None:
+        failureWindow = datetime.timedelta(minutes=utility.failureWindow)
+    return AuditOptions(expiresAfter, lockOutPeriod, utility.maxFailedAttempts,
+                        failureWindow)
+
+
+def auditState(state, options, now):
+    """Audit the ``AccountState`` with the ``AuditOptions`` at ``now``."""
+    expiresAfter = state.passwordExpiresAfter
+    if expiresAfter is None:
+        expiresAfter = options.passwordExpiresAfter
+    lockOutPeriod = state.lockOutPeriod
+    if lockOutPeriod is None:
+        lockOutPeriod = options.lockOutPeriod
+    maxFailedAttempts = state.maxFailedAttempts
+    if maxFailedAttempts is None:
+        maxFailedAttempts = options.maxFailedAttempts
+
+    expiresOn = None
+    if expiresAfter is not None and state.passwordSetOn is not None:
+        expiresOn = state.passwordSetOn + expiresAfter
+    forced = bool(state.passwordExpired)
+    expired = forced or (expiresOn is not None and expiresOn < now)
+
+    tooManyFailures = (maxFailedAttempts is not None
+                       and state.failedAttempts >= maxFailedAttempts)
+    locked = tooManyFailures and (
+        lockOutPeriod is None
+        or (state.lastFailedAttempt is not None
+            and state.lastFailedAttempt + lockOutPeriod > now))
+    return AuditResult(
+        state.key, expiresOn, expired, forced, tooManyFailures, locked)
+
+
+def _auditChunk(states, optionsByName, now):
+    # module level, so that process pools can pickle it
+    return [auditState(state, optionsByName[state.optionsName], now)
+            for state in states]
+
+
+class _Resolver:
+    """Resolves the options and login failure stores once per name."""
+
+    def __init__(self):
+        self.options = {}
+        self.stores = {}
+
+    def resolve(self, name):
+        if name not in self.options:
+            if name:
+                # if we have a utility name, then it must be there
+                utility = zope.component.getUtility(
+                    interfaces.IPasswordOptionsUtility, name=name)
+            else:
+                utility = zope.component.queryUtility(
+                    interfaces.IPasswordOptionsUtility)
+            self.options[name] = optionsOf(utility)
+
+    def state(self, principal):
+        optionsName = principal.passwordOptionsUtilityName or None
+        failedAttempts = principal.failedAttempts
+        lastFailedAttempt = principal.lastFailedAttempt
+        storeName = principal.loginFailureStoreName
+        if storeName is not None:
+            if storeName not in self.stores:
+                self.stores[storeName] = zope.component.getUtility(
+                    interfaces.ILoginFailureStore, name=storeName)
+            store = self.stores[storeName]
+            key = principal._loginFailureKey()
+            # count the failures like ``PrincipalMixIn.checkPassword()``
+            window = principal.failureWindow
+            if window is None:
+                self.resolve(optionsName)
+                window = self.options[optionsName].failureWindow
+            if (window is not None
+                    and interfaces.IWindowedLoginFailureStore.providedBy(
+                        store)):
+                failedAttempts, lastFailedAttempt = store.getWithin(
+                    key, window)
+            else:
+                failedAttempts, lastFailedAttempt = store.get(key)
+        return AccountState(
+            principal.login, principal.passwordSetOn,
+            principal.passwordExpired, failedAttempts, lastFailedAttempt,
+            principal.passwordExpiresAfter, principal.lockOutPeriod,
+            principal.maxFailedAttempts, optionsName)
+
+    def chunk(self, records):
+        states = []
+        for record in records:
+            if not isinstance(record, AccountState):
+                record = self.state(record)
+            self.resolve(record.optionsName)
+            states.append(record)
+        return states
+
+
+def audit(records, now=None, chunkSize=1000, executor=None, maxPending=4):
+    """Audit accounts in bulk, yielding an ``AuditResult`` for each.
+
+    The ``records`` are principals using the ``PrincipalMixIn`` or
+    ``AccountState`` records. The options utilities and login failure stores
+    are looked up once per name. The records are audited in chunks of
+    ``chunkSize``, optionally by an ``executor``, e.g. a process pool, with
+    at most ``maxPending`` chunks submitted at the same time. The results
+    are yielded in the order of the records, as soon as their chunk is done.
+    """
+    if now is None:
+        now = datetime.datetime.now()
+    resolver = _Resolver()
+    records = iter(records)
+    chunks = iter(
+        lambda: resolver.chunk(itertools.islice(records, chunkSize)), [])
+
+    if executor is None:
+        for states in chunks:
+            yield from _auditChunk(states, resolver.options, now)
+        return
+
+    pending = collections.deque()
+    try:
+        for states in chunks:
+            pending.append(executor.submit(
+                _auditChunk, states, dict(resolver.options), now))
+            if len(pending) >= maxPending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,290 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Password Blocklist
+
+A blocklist file holds the sorted, fixed size prefixes of the SHA-1 hashes
+of the blocked passwords, after a header::
+
+  magic (8 bytes) | prefix size (1) | flags (1) | reserved (6) | count (8)
+
+The file is memory mapped, so that it is not parsed on startup and all
+processes share its pages. Build it with::
+
+  $ python -m z3c.password.blocklist passwords.txt blocklist.bin
+"""
+import argparse
+import hashlib
+import heapq
+import itertools
+import mmap
+import os
+import struct
+import sys
+import tempfile
+
+import zope.interface
+
+from z3c.password import interfaces
+from z3c.password.password import checkWith
+from z3c.password.password import generateManyWith
+from z3c.password.password import verifyAllWith
+
+
+MAGIC = b'Z3CPWBL1'
+HEADER = struct.Struct('>8sBB6xQ')
+# the passwords were lowercased before hashing
+LOWERCASE = 0x01
+
+
+def _hash(password, lowercase):
+    if lowercase:
+        password = password.lower()
+    return hashlib.sha1(password.encode('utf-8')).digest()
+
+
+class Blocklist:
+    """A memory mapped blocklist file."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.prefixSize, flags, self._count = HEADER.unpack_from(
+            self._map)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError('Not a password blocklist: %s' % path)
+        self.lowercase = bool(flags & LOWERCASE)
+        if len(self._map) != HEADER.size + self._count * self.prefixSize:
+            self._map.close()
+            raise ValueError('Truncated password blocklist: %s' % path)
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, password):
+        return self.containsHash(_hash(password, self.lowercase))
+
+    def containsHash(self, digest):
+        """Return whether a SHA-1 digest is blocked."""
+        prefix = digest[:self.prefixSize]
+        size = self.prefixSize
+        data = self._map
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = HEADER.size + mid * size
+            entry = data[offset:offset + size]
+            if entry < prefix:
+                lo = mid + 1
+            elif entry > prefix:
+                hi = mid
+            else:
+                return True
+        return False
+
+    def close(self):
+        self._map.close()
+
+
+@zope.interface.implementer(interfaces.IPasswordUtility)
+class BlocklistPasswordUtility:
+    """A password utility refusing the passwords of a blocklist file with a
+    ``BlockedPassword`` error, in addition to the rules of the ``utility``
+    it wraps.
+
+    The file is opened on first use in each process. The passwords are
+    generated by the wrapped utility and generated again when blocked.
+    """
+
+    maxGenerateAttempts = 100
+
+    def __init__(self, utility, path):
+        self.utility = utility
+        self.path = path
+        self._blocklist = None
+
+    def __getstate__(self):
+        # the memory map cannot be pickled, it is opened again on demand
+        state = self.__dict__.copy()
+        state['_blocklist'] = None
+        return state
+
+    @property
+    def blocklist(self):
+        blocklist = self._blocklist
+        if blocklist is None:
+            blocklist = self._blocklist = Blocklist(self.path)
+        return blocklist
+
+    @property
+    def description(self):
+        return self.utility.description
+
+    def _checkBlocked(self, new):
+        if new and new in self.blocklist:
+            return interfaces.BlockedPassword()
+        return None
+
+    def verify(self, new, ref=None):
+        '''See interfaces.IPasswordUtility'''
+        error = self.check(new, ref)
+        if error is not None:
+            raise error
+
+    def check(self, new, ref=None):
+        '''See interfaces.IPasswordUtility'''
+        error = checkWith(self.utility, new, ref)
+        if error is None:
+            error = self._checkBlocked(new)
+        return error
+
+    def verifyAll(self, new, ref=None):
+        '''See interfaces.IPasswordUtility'''
+        errors = list(verifyAllWith(self.utility, new, ref))
+        error = self._checkBlocked(new)
+        if error is not None:
+            errors.append(error)
+        return errors
+
+    def generate(self, ref=None):
+        '''See interfaces.IPasswordUtility'''
+        for count in range(self.maxGenerateAttempts):
+            new = self.utility.generate(ref)
+            if new not in self.blocklist:
+                return new
+        raise ValueError(
+            'No password outside of the blocklist generated in %i attempts.'
+            % self.maxGenerateAttempts)
+
+    def generateMany(self, n, refs=None):
+        '''See interfaces.IPasswordUtility'''
+        if refs is None:
+            refs = itertools.repeat(None, n)
+        # pair the passwords with their reference passwords
+        refs, mine = itertools.tee(refs)
+        news = generateManyWith(self.utility, n, refs)
+        return (new if new not in self.blocklist else self.generate(ref)
+                for new, ref in zip(news, mine))
+
+
+def _writeRun(prefixes, directory):
+    prefixes.sort()
+    run = tempfile.TemporaryFile(dir=directory)
+    run.write(b''.join(prefixes))
+    run.seek(0)
+    return run
+
+
+def _readRun(run, size):
+    while True:
+        prefix = run.read(size)
+        if not prefix:
+            return
+        yield prefix
+
+
+def build(lines, path, prefixSize=8, lowercase=False, hashed=False,
+          chunkSize=1000000, tempdir=None):
+    """Write the blocklist file of the passwords in ``lines``.
+
+    With ``hashed`` the lines are hexadecimal SHA-1 hashes instead, like the
+    ones published of breached passwords; anything after a colon is ignored.
+    Other hashes are refused with a ``ValueError``.
+    The prefixes are sorted in runs of ``chunkSize`` entries in temporary
+    files, which are merged, so the memory used does not depend on the size
+    of the list. Returns the amount of distinct prefixes written.
+    """
+    if not 4 <= prefixSize <= 20:
+        raise ValueError('The prefix size must be between 4 and 20 bytes.')
+    runs = []
+    chunk = []
+    try:
+        for line in lines:
+            line = line.rstrip('\r\n')
+            if not line:
+                continue
+            if hashed:
+                text = line.split(':', 1)[0].strip()
+                digest = bytes.fromhex(text)
+                if len(digest) != 20:
+                    # other hashes never match the SHA-1 of a password
+                    raise ValueError('Not a SHA-1 hash: %s' % text)
+            else:
+                digest = _hash(line, lowercase)
+            chunk.append(digest[:prefixSize])
+            if len(chunk) >= chunkSize:
+                runs.append(_writeRun(chunk, tempdir))
+                chunk = []
+        if chunk or not runs:
+            runs.append(_writeRun(chunk, tempdir))
+
+        count = 0
+        flags = LOWERCASE if lowercase and not hashed else 0
+        with open(path, 'wb') as out:
+            out.write(HEADER.pack(MAGIC, prefixSize, flags, 0))
+            previous = None
+            for prefix in heapq.merge(
+                    *[_readRun(run, prefixSize) for run in runs]):
+                if prefix != previous:
+                    out.write(prefix)
+                    count += 1
+                    previous = prefix
+            out.seek(0)
+            out.write(HEADER.pack(MAGIC, prefixSize, flags, count))
+    finally:
+        for run in runs:
+            run.close()
+    return count
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m z3c.password.blocklist',
+        description='Build a password blocklist file from a text file with '
+                    'one password per line.')
+    parser.add_argument('input', help='the text file, - for stdin')
+    parser.add_argument('output', help='the blocklist file to write')
+    parser.add_argument(
+        '--prefix-size', type=int, default=8,
+        help='bytes of each SHA-1 hash kept (default: 8)')
+    parser.add_argument(
+        '--lowercase', action='store_true',
+        help='block the passwords regardless of their case')
+    parser.add_argument(
+        '--hashed', action='store_true',
+        help='the lines are hexadecimal SHA-1 hashes')
+    parser.add_argument(
+        '--chunk-size', type=int, default=1000000,
+        help='entries sorted in memory at once (default: 1000000)')
+    options = parser.parse_args(args)
+
+    if options.input == '-':
+        input = sys.stdin
+    else:
+        input = open(options.input, encoding='utf-8', errors='replace')
+    try:
+        count = build(
+            input, options.output, prefixSize=options.prefix_size,
+            lowercase=options.lowercase, hashed=options.hashed,
+            chunkSize=options.chunk_size,
+            tempdir=os.path.dirname(os.path.abspath(options.output)))
+    finally:
+        if input is not sys.stdin:
+            input.close()
+    print('%i entries written to %s' % (count, options.output))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Composition of Password Utilities
+"""
+import itertools
+import threading
+import time
+
+import zope.component
+import zope.interface
+
+from z3c.password import interfaces
+from z3c.password.password import checkWith
+from z3c.password.password import generateManyWith
+from z3c.password.password import verifyAllWith
+
+
+class RuleCosts:
+    """The costs of the rules of a composite password utility, measured at
+    runtime and kept by the position of the rule.
+
+    The rules are ordered by their ``priority``, the seconds per check
+    divided by the rate of rejections. Running the rules of the lowest
+    priority first minimizes the expected time to find the first violated
+    rule. Rules that were not measured yet come first, so they get measured.
+    """
+
+    def __init__(self, rules):
+        self._lock = threading.Lock()
+        self.rules = rules
+        count = len(rules)
+        self.checks = [0] * count
+        self.rejections = [0] * count
+        self.seconds = [0.0] * count
+        # The positions of the rules, in the order to check them.
+        self.order = tuple(range(count))
+        self._pending = 0
+
+    def cost(self, idx):
+        """The average seconds per check of the rule."""
+        if not self.checks[idx]:
+            return 0.0
+        return self.seconds[idx] / self.checks[idx]
+
+    def rejectionRate(self, idx):
+        """The estimated rate of rejections of the rule."""
+        return (self.rejections[idx] + 1) / (self.checks[idx] + 2)
+
+    def priority(self, idx):
+        return self.cost(idx) / self.rejectionRate(idx)
+
+    def record(self, idx, seconds, rejected):
+        with self._lock:
+            self.checks[idx] += 1
+            self.rejections[idx] += rejected
+            self.seconds[idx] += seconds
+
+    def recordCheck(self, reorderInterval):
+        """Count a check, reordering the rules every ``reorderInterval``."""
+        with self._lock:
+            self._pending += 1
+            if self._pending < reorderInterval:
+                return
+            self._pending = 0
+        self.reorder()
+
+    def reorder(self):
+        positions = range(len(self.checks))
+        self.order = tuple(sorted(
+            positions, key=lambda idx: (self.priority(idx), idx)))
+
+
+@zope.interface.implementer(interfaces.IPasswordUtility)
+class CompositePasswordUtility:
+    """A password utility accepting only the passwords accepted by all its
+    ``rules``.
+
+    The rules are password utilities or the names of password utilities,
+    which are looked up on use. ``check()`` and ``verify()`` stop at the
+    first rule rejecting the password, trying the cheap rules that reject
+    often first, as measured in ``costs``. So the error reported for a
+    password violating several rules depends on the measured costs.
+    ``verifyAll()`` runs all rules and returns their errors in the order of
+    the rules.
+
+    The passwords are generated by the ``generator``, by default the first
+    rule, and generated again until all rules accept them.
+    """
+
+    maxGenerateAttempts = 100
+
+    # The amount of checks between reordering the rules by their costs.
+    reorderInterval = 100
+
+    _v_costs = None
+
+    def __init__(self, rules, generator=None):
+        self.rules = tuple(rules)
+        self.generator = generator
+
+    def __getstate__(self):
+        # the costs hold a lock and are measured again after loading
+        state = self.__dict__.copy()
+        state.pop('_v_costs', None)
+        return state
+
+    @property
+    def costs(self):
+        """The ``RuleCosts`` of the rules, measured since they were set."""
+        costs = self._v_costs
+        if costs is None or costs.rules is not self.rules:
+            costs = self._v_costs = RuleCosts(self.rules)
+        return costs
+
+    def _rule(self, rule):
+        if isinstance(rule, str):
+            return zope.component.getUtility(
+                interfaces.IPasswordUtility, rule)
+        return rule
+
+    @property
+    def description(self):
+        return ' '.join(
+            filter(None, (getattr(self._rule(rule), 'description', None)
+                          for rule in self.rules)))
+
+    def verify(self, new, ref=None):
+        '''See interfaces.IPasswordUtility'''
+        error = self.check(new, ref)
+        if error is not None:
+            raise error
+
+    def check(self, new, ref=None):
+        '''See interfaces.IPasswordUtility'''
+        costs = self.costs
+        error = None
+        for idx in costs.order:
+            rule = self._rule(self.rules[idx])
+            start = time.perf_counter()
+            error = checkWith(rule, new, ref)
+            costs.record(idx, time.perf_counter() - start, error is not None)
+            if error is not None:
+                break
+        costs.recordCheck(self.reorderInterval)
+        return error
+
+    def verifyAll(self, new, ref=None):
+        '''See interfaces.IPasswordUtility'''
+        costs = self.costs
+        errors = [()] * len(self.rules)
+        for idx in costs.order:
+            rule = self._rule(self.rules[idx])
+            start = time.perf_counter()
+            errors[idx] = verifyAllWith(rule, new, ref)
+            costs.record(idx, time.perf_counter() - start, bool(errors[idx]))
+        costs.recordCheck(self.reorderInterval)
+        return [error for ruleErrors in errors for error in ruleErrors]
+
+    def _generator(self):
+        if self.generator is not None:
+            return self._rule(self.generator)
+        return self._rule(self.rules[0])
+
+    def generate(self, ref=None):
+        '''See interfaces.IPasswordUtility'''
+        generator = self._generator()
+        for count in range(self.maxGenerateAttempts):
+            new = generator.generate(ref)
+            if self.check(new, ref) is None:
+                return new
+        raise ValueError(
+            'No password accepted by all rules generated in %i attempts.'
+            % self.maxGenerateAttempts)
+
+    def generateMany(self, n, refs=None):
+        '''See interfaces.IPasswordUtility'''
+        if refs is None:
+            refs = itertools.repeat(None, n)
+        # pair the passwords with their reference passwords
+        refs, mine = itertools.tee(refs)
+        news = generateManyWith(self._generator(), n, refs)
+        return (new if self.check(new, ref) is None else self.generate(ref)
+                for new, ref in zip(news, mine))
@@ -0,0 +1,110 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Verified Credential Cache
+"""
+import collections
+import hashlib
+import hmac
+import os
+import threading
+import time
+
+import zope.interface
+
+from z3c.password import interfaces
+
+
+@zope.interface.implementer(interfaces.ICredentialCache)
+class CredentialCache:
+    """A bounded, least recently used cache of verified credentials, which
+    expire after ``timeout`` seconds.
+
+    Only the last verified credentials of each principal are kept, as a
+    BLAKE2 MAC with a random key of the cache. The MAC covers the encoded
+    password too, so credentials verified against a replaced password never
+    match.
+
+    The key is not persisted, so the cache should be registered as global
+    utility. It is shared by all threads of the process.
+    """
+
+    def __init__(self, maxSize=1024, timeout=60):
+        self.maxSize = maxSize
+        self.timeout = timeout
+        self._secret = os.urandom(hashlib.blake2b.MAX_KEY_SIZE)
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def clock(self):
+        # hook to facilitate testing
+        return time.monotonic()
+
+    def _digest(self, key, managerName, encoded, password):
+        mac = hashlib.blake2b(key=self._secret, digest_size=16)
+        for part in (key, managerName, encoded, password):
+            if part is None:
+                part = b''
+            elif isinstance(part, str):
+                part = part.encode('utf-8')
+            # the length prefix keeps the parts apart
+            mac.update(len(part).to_bytes(8, 'big'))
+            mac.update(part)
+        return mac.digest()
+
+    def isVerified(self, key, managerName, encoded, password):
+        '''See interfaces.ICredentialCache'''
+        digest = self._digest(key, managerName, encoded, password)
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[1] <= now:
+                    del self._entries[key]
+                elif hmac.compare_digest(entry[0], digest):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True
+            self.misses += 1
+            return False
+
+    def remember(self, key, managerName, encoded, password):
+        '''See interfaces.ICredentialCache'''
+        digest = self._digest(key, managerName, encoded, password)
+        expires = self.clock() + self.timeout
+        with self._lock:
+            self._entries[key] = (digest, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxSize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        '''See interfaces.ICredentialCache'''
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        '''See interfaces.ICredentialCache'''
+        with self._lock:
+            self._entries.clear()
+
+    def resetStatistics(self):
+        """Reset the hit and miss counters."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
@@ -17,13 +17,21 @@ import zope.component
 import zope.schema
 
 from z3c.password import interfaces
+from z3c.password.composite import CompositePasswordUtility
 
 
 class Password(zope.schema.Password):
 
-    def __init__(self, checker=None, ignoreEmpty=False, **kw):
+    def __init__(self, checker=None, ignoreEmpty=False, reportAll=False,
+                 **kw):
+        if isinstance(checker, (list, tuple)):
+            # the rules of a composite, measuring its costs for all
+            # validations
+            checker = CompositePasswordUtility(checker)
         self._checker = checker
         self._ignoreEmpty = ignoreEmpty
+        # raise all violated rules at once, as ``PasswordViolations``
+        self._reportAll = reportAll
         super().__init__(**kw)
 
     @property
@@ -35,7 +43,16 @@ class Password(zope.schema.Password):
         return zope.component.getUtility(
             interfaces.IPasswordUtility, self._checker)
 
-    def validate(self, value):
+    def _oldValue(self):
+        old = None
+        if self.context is not None:
+            try:
+                old = self.get(self.context)
+            except AttributeError:
+                pass
+        return old
+
+    def _validatePassword(self, value, checker, old):
         if not value and self._ignoreEmpty:
             # leaving a password empty worked fine with formlib,
             # but seems not to work with z3c.form, value get always validated
@@ -43,15 +60,16 @@ class Password(zope.schema.Password):
             return
 
         super().validate(value)
-        old = None
-        if self.context is not None:
-            try:
-                old = self.get(self.context)
-            except AttributeError:
-                pass
-        checker = self.checker
         if checker is not None:
-            self.checker.verify(value, old)
+            verifyAll = getattr(checker, 'verifyAll', None)
+            if self._reportAll and verifyAll is not None:
+                errors = verifyAll(value, old)
+                if len(errors) > 1:
+                    raise interfaces.PasswordViolations(errors)
+                if errors:
+                    raise errors[0]
+            else:
+                checker.verify(value, old)
 
         # try to check for disallowPasswordReuse here too, to raise
         # problems ASAP
@@ -61,3 +79,19 @@ class Password(zope.schema.Password):
             except AttributeError:
                 # if _checkDisallowedPreviousPassword is missing
                 pass
+
+    def validate(self, value):
+        if not value and self._ignoreEmpty:
+            return
+        self._validatePassword(value, self.checker, self._oldValue())
+
+    def validateMany(self, values):
+        """Validate many values, e.g. of a bulk import.
+
+        The checker and the old value are resolved only once for all values.
+        The first invalid value raises its error.
+        """
+        checker = self.checker
+        old = self._oldValue()
+        for value in values:
+            self._validatePassword(value, checker, old)
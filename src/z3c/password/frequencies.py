@@ -0,0 +1,115 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Ranked Frequency Lists for the Strength Estimation
+
+Each list holds whitespace separated, lowercase words, the most frequent
+first. The lists are only imported by ``strength.PatternStrength`` when it
+estimates its first password.
+"""
+
+PASSWORDS = """
+123456 password 12345678 qwerty 123456789 12345 1234 111111 1234567 dragon
+123123 baseball abc123 football monkey letmein 696969 shadow master 666666
+qwertyuiop 123321 mustang 1234567890 michael 654321 superman 1qaz2wsx
+7777777 121212 000000 qazwsx 123qwe killer trustno1 jordan jennifer
+zxcvbnm asdfgh hunter buster soccer harley batman andrew tigger sunshine
+iloveyou 2000 charlie robert thomas hockey ranger daniel starwars klaster
+112233 george computer michelle jessica pepper 1111 zxcvbn 555555 11111111
+131313 freedom 777777 pass maggie 159753 aaaaaa ginger princess joshua
+cheese amanda summer love ashley nicole chelsea biteme matthew access
+yankees 987654321 dallas austin thunder taylor matrix william corvette
+hello martin heather secret merlin diamond 1234qwer gfhjkm hammer silver
+222222 88888888 anthony justin test bailey q1w2e3r4t5 patrick internet
+scooter orange 11111 golfer cookie richard samantha bigdog guitar jackson
+whatever mickey chicken sparky snoopy maverick phoenix camaro peanut
+morgan welcome falcon cowboy ferrari samsung andrea smokey steelers joseph
+mercedes dakota arsenal eagles melissa boomer booboo spider nascar monster
+tigers yellow xxxxxx 123123123 gateway marina diablo bulldog qwer1234
+compaq purple hardcore banana junior hannah 123654 porsche lakers iceman
+money cowboys 987654 london tennis 999999 ncc1701 coffee scooby 0000
+miller boston q1w2e3r4 brandon yamaha chester mother forever johnny edward
+333333 oliver redsox player nikita knight fender barney midnight please
+brandy chicago badboy slayer rangers charles angel flower bigdaddy rabbit
+wizard bigdick jasper enter rachel chris 7777 helpme qwerty123 password1
+admin administrator root changeme default guest login welcome1 passw0rd
+p@ssw0rd letmein1 abcdef abcd1234 1q2w3e4r 1q2w3e 123abc qwe123 zaq12wsx
+asdf asdfghjkl qweasd qweasdzxc monkey1 dragon1 iloveyou1 princess1
+sunshine1 football1 baseball1 superman1 master1 shadow1 trustno1 hello123
+"""
+
+WORDS = """
+the be to of and a in that have it for not on with he as you do at this
+but his by from they we say her she or an will my one all would there
+their what so up out if about who get which go me when make can like time
+no just him know take people into year your good some could them see other
+than then now look only come its over think also back after use two how
+our work first well way even new want because any these give day most us
+man woman child world life hand part place case week company system
+program question government number night point home water room mother
+area money story fact month lot right study book eye job word business
+issue side kind head house service friend father power hour game line end
+member law car city community name president team minute idea kid body
+information school face others level office door health person art war
+history party result change morning reason research girl guy moment air
+teacher force education foot boy age policy music market sense nation
+plan college interest death experience effect class control care field
+development role effort rate heart drug show leader light voice wife
+police mind price report decision son view relationship town road arm
+difference value building action model season society tax director
+position player record paper space ground form event official matter
+center couple site project activity star table need court oil situation
+cost industry figure street image phone data picture practice piece land
+product doctor wall patient worker news test movie north love support
+technology step baby computer type attention film tree source organization
+hair window evidence population truth song energy machine summer winter
+spring autumn fall garden flower rose lily daisy sun moon sky cloud rain
+snow storm wind fire earth stone rock river lake sea ocean beach island
+mountain hill valley forest desert king queen prince princess castle
+knight dragon tiger lion bear wolf eagle falcon hawk horse dog cat puppy
+kitty bird fish shark whale dolphin monkey snake spider rabbit mouse
+apple orange banana cherry lemon peach grape berry melon cookie candy
+sugar honey chocolate cheese bread butter pizza pasta coffee tea beer wine
+red blue green yellow black white purple pink brown silver gold golden
+diamond crystal magic secret hidden shadow dark light angel devil heaven
+hell god jesus christ lord faith hope grace peace happy lucky sweet
+sunny funny crazy cool hot super power strong master hunter killer
+soldier warrior ninja pirate captain doctor pilot rocket star planet
+galaxy space alien robot matrix cyber hacker code password login admin
+user guest access enter letmein welcome hello goodbye thanks please
+friend buddy family baby honey darling lover sweetheart kiss hug heart
+soul dream forever always never nothing something everything freedom
+liberty justice america london paris berlin moscow tokyo china texas
+florida california chicago boston dallas miami football soccer baseball
+hockey tennis golf basketball yankees lakers cowboys eagles tigers bears
+lions giants rangers steelers arsenal chelsea liverpool barcelona madrid
+michael james john robert david william richard joseph thomas charles
+daniel matthew anthony mark paul steven andrew joshua kevin brian george
+edward ronald timothy jason jeffrey ryan jacob gary nicholas eric
+jonathan stephen larry justin scott brandon benjamin samuel frank gregory
+alexander patrick jack dennis jerry tyler aaron henry adam peter nathan
+zachary kyle walter harold jeremy ethan carl keith roger gerald christian
+terry sean arthur austin noah lawrence jesse joe bryan billy jordan albert
+dylan bruce willie gabriel alan juan logan wayne ralph roy eugene randy
+vincent russell louis philip bobby johnny bradley mary patricia jennifer
+linda elizabeth barbara susan jessica sarah karen nancy lisa betty
+margaret sandra ashley kimberly emily donna michelle dorothy carol amanda
+melissa deborah stephanie rebecca sharon laura cynthia kathleen amy
+shirley angela helen anna brenda pamela nicole emma samantha katherine
+christine debra rachel catherine carolyn janet ruth maria heather diane
+virginia julie joyce victoria olivia kelly christina lauren joan evelyn
+judith megan cheryl andrea hannah martha jacqueline frances gloria ann
+teresa kathryn sara janice jean alice madison doris abigail julia judy
+grace denise amber marilyn beverly danielle theresa sophia marie diana
+brittany natalie isabella charlotte rose alexis kayla
+"""
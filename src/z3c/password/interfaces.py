@@ -13,17 +13,38 @@
 ##############################################################################
 """Password Utility Interfaces
 """
+import zope.component
 import zope.interface
 import zope.schema
+import zope.schema.interfaces
+import zope.schema.vocabulary
 from zope.i18n import translate
 
 from z3c.password import MessageFactory as _
 
 
 class InvalidPassword(zope.schema.ValidationError):
-    """Invalid Password"""
+    """Invalid Password
 
-    i18n_message = None
+    The details of the violation are kept as attributes. The i18n message is
+    only built from them when it is needed, so creating the error is cheap.
+    """
+
+    _i18n_message = None
+
+    def _buildMessage(self):
+        # hook for the subclasses building a message from their details
+        return None
+
+    @property
+    def i18n_message(self):
+        if self._i18n_message is None:
+            self._i18n_message = self._buildMessage()
+        return self._i18n_message
+
+    @i18n_message.setter
+    def i18n_message(self, value):
+        self._i18n_message = value
 
     def __str__(self):
         if self.i18n_message:
@@ -46,10 +67,12 @@ class TooShortPassword(InvalidPassword):
     def __init__(self, minLength=None):
         super().__init__()
         self.minLength = minLength
-        if minLength is not None:
-            self.i18n_message = _(
+
+    def _buildMessage(self):
+        if self.minLength is not None:
+            return _(
                 'Password is too short (minimum length: ${minLength}).',
-                mapping=dict(minLength=minLength))
+                mapping=dict(minLength=self.minLength))
 
 
 class TooLongPassword(InvalidPassword):
@@ -58,10 +81,12 @@ class TooLongPassword(InvalidPassword):
     def __init__(self, maxLength=None):
         super().__init__()
         self.maxLength = maxLength
-        if maxLength is not None:
-            self.i18n_message = _(
+
+    def _buildMessage(self):
+        if self.maxLength is not None:
+            return _(
                 'Password is too long (maximum length: ${maxLength}).',
-                mapping=dict(maxLength=maxLength))
+                mapping=dict(maxLength=self.maxLength))
 
 
 class TooSimilarPassword(InvalidPassword):
@@ -71,13 +96,16 @@ class TooSimilarPassword(InvalidPassword):
         super().__init__()
         self.similarity = similarity
         self.maxSimilarity = maxSimilarity
-        if similarity is not None and maxSimilarity is not None:
-            self.i18n_message = _(
+
+    def _buildMessage(self):
+        if self.similarity is not None and self.maxSimilarity is not None:
+            return _(
                 'Password is too similar to old one'
                 ' (similarity ${similarity}%, should be at most'
                 ' ${maxSimilarity}%).',
-                mapping=dict(similarity=int(round(similarity * 100)),
-                             maxSimilarity=int(maxSimilarity * 100)))
+                mapping=dict(
+                    similarity=int(round(self.similarity * 100)),
+                    maxSimilarity=int(self.maxSimilarity * 100)))
 
 
 class TooManyGroupCharacters(InvalidPassword):
@@ -86,11 +114,13 @@ class TooManyGroupCharacters(InvalidPassword):
     def __init__(self, groupMax=None):
         super().__init__()
         self.groupMax = groupMax
-        if groupMax is not None:
-            self.i18n_message = _(
+
+    def _buildMessage(self):
+        if self.groupMax is not None:
+            return _(
                 'Password contains too many characters of one group'
                 ' (should have at most ${groupMax}).',
-                mapping=dict(groupMax=groupMax))
+                mapping=dict(groupMax=self.groupMax))
 
 
 class TooFewGroupCharacters(InvalidPassword):
@@ -105,11 +135,13 @@ class TooFewGroupCharactersLowerLetter(TooFewGroupCharacters):
     def __init__(self, minLowerLetter=None):
         super().__init__()
         self.minLowerLetter = minLowerLetter
-        if minLowerLetter is not None:
-            self.i18n_message = _(
+
+    def _buildMessage(self):
+        if self.minLowerLetter is not None:
+            return _(
                 'Password does not contain enough characters of lowercase'
                 ' letters (should have at least ${minLowerLetter}).',
-                mapping=dict(minLowerLetter=minLowerLetter))
+                mapping=dict(minLowerLetter=self.minLowerLetter))
 
 
 class TooFewGroupCharactersUpperLetter(TooFewGroupCharacters):
@@ -119,11 +151,13 @@ class TooFewGroupCharactersUpperLetter(TooFewGroupCharacters):
     def __init__(self, minUpperLetter=None):
         super().__init__()
         self.minUpperLetter = minUpperLetter
-        if minUpperLetter is not None:
-            self.i18n_message = _(
+
+    def _buildMessage(self):
+        if self.minUpperLetter is not None:
+            return _(
                 'Password does not contain enough characters of uppercase'
                 ' letters (should have at least ${minUpperLetter}).',
-                mapping=dict(minUpperLetter=minUpperLetter))
+                mapping=dict(minUpperLetter=self.minUpperLetter))
 
 
 class TooFewGroupCharactersDigits(TooFewGroupCharacters):
@@ -132,11 +166,13 @@ class TooFewGroupCharactersDigits(TooFewGroupCharacters):
     def __init__(self, minDigits=None):
         super().__init__()
         self.minDigits = minDigits
-        if minDigits is not None:
-            self.i18n_message = _(
+
+    def _buildMessage(self):
+        if self.minDigits is not None:
+            return _(
                 'Password does not contain enough characters of digits'
                 ' (should have at least ${minDigits}).',
-                mapping=dict(minDigits=minDigits))
+                mapping=dict(minDigits=self.minDigits))
 
 
 class TooFewGroupCharactersSpecials(TooFewGroupCharacters):
@@ -146,11 +182,13 @@ class TooFewGroupCharactersSpecials(TooFewGroupCharacters):
     def __init__(self, minSpecials=None):
         super().__init__()
         self.minSpecials = minSpecials
-        if minSpecials is not None:
-            self.i18n_message = _(
+
+    def _buildMessage(self):
+        if self.minSpecials is not None:
+            return _(
                 'Password does not contain enough characters of special'
                 ' characters (should have at least ${minSpecials}).',
-                mapping=dict(minSpecials=minSpecials))
+                mapping=dict(minSpecials=self.minSpecials))
 
 
 class TooFewGroupCharactersOthers(TooFewGroupCharacters):
@@ -160,11 +198,13 @@ class TooFewGroupCharactersOthers(TooFewGroupCharacters):
     def __init__(self, minOthers=None):
         super().__init__()
         self.minOthers = minOthers
-        if minOthers is not None:
-            self.i18n_message = _(
+
+    def _buildMessage(self):
+        if self.minOthers is not None:
+            return _(
                 'Password does not contain enough characters of other'
                 ' characters (should have at least ${minOthers}).',
-                mapping=dict(minOthers=minOthers))
+                mapping=dict(minOthers=self.minOthers))
 
 
 class TooFewUniqueCharacters(InvalidPassword):
@@ -173,11 +213,13 @@ class TooFewUniqueCharacters(InvalidPassword):
     def __init__(self, minUniqueCharacters=None):
         super().__init__()
         self.minUniqueCharacters = minUniqueCharacters
-        if minUniqueCharacters is not None:
-            self.i18n_message = _(
+
+    def _buildMessage(self):
+        if self.minUniqueCharacters is not None:
+            return _(
                 'Password does not contain enough unique characters'
                 ' (should have at least ${minUniqueCharacters}).',
-                mapping=dict(minUniqueCharacters=minUniqueCharacters))
+                mapping=dict(minUniqueCharacters=self.minUniqueCharacters))
 
 
 class TooFewUniqueLetters(InvalidPassword):
@@ -186,11 +228,58 @@ class TooFewUniqueLetters(InvalidPassword):
     def __init__(self, minUniqueLetters=None):
         super().__init__()
         self.minUniqueLetters = minUniqueLetters
-        if minUniqueLetters is not None:
-            self.i18n_message = _(
+
+    def _buildMessage(self):
+        if self.minUniqueLetters is not None:
+            return _(
                 'Password does not contain enough unique letters'
                 ' (should have at least ${minUniqueLetters}).',
-                mapping=dict(minUniqueLetters=minUniqueLetters))
+                mapping=dict(minUniqueLetters=self.minUniqueLetters))
+
+
+class TooWeakPassword(InvalidPassword):
+    __doc__ = _('''Password is too easy to guess.''')
+
+    def __init__(self, entropyBits=None, minEntropyBits=None):
+        super().__init__()
+        self.entropyBits = entropyBits
+        self.minEntropyBits = minEntropyBits
+
+    def _buildMessage(self):
+        if self.entropyBits is not None and self.minEntropyBits is not None:
+            return _(
+                'Password is too easy to guess (strength ${entropyBits} bits,'
+                ' should be at least ${minEntropyBits}).',
+                mapping=dict(entropyBits=round(self.entropyBits),
+                             minEntropyBits=self.minEntropyBits))
+
+
+class BlockedPassword(InvalidPassword):
+    __doc__ = _('''Password is too common.''')
+
+
+class PasswordViolations(InvalidPassword):
+    __doc__ = _('''Password violates several rules.''')
+
+    def __init__(self, errors=()):
+        super().__init__()
+        self.errors = list(errors)
+
+    def _buildMessage(self):
+        # Nest the messages of the errors, so that each is translated.
+        messages = [error.doc() for error in self.errors]
+        if not messages:
+            return None
+        violations = messages[-1]
+        for message in reversed(messages[:-1]):
+            violations = _('${violation} ${violations}',
+                           mapping=dict(violation=message,
+                                        violations=violations))
+        return _('Password violates several rules: ${violations}',
+                 mapping=dict(violations=violations))
+
+    def __str__(self):
+        return ' '.join(str(error) for error in self.errors)
 
 
 class PasswordExpired(Exception):
@@ -217,6 +306,14 @@ class TooManyLoginFailures(Exception):
         Exception.__init__(self, self.__doc__)
 
 
+class TooManyAddressFailures(TooManyLoginFailures):
+    __doc__ = _('''Too many logins from this address failed.''')
+
+    def __init__(self, principal, address):
+        self.address = address
+        TooManyLoginFailures.__init__(self, principal)
+
+
 TML_CHECK_ALL = None
 TML_CHECK_NONRESOURCE = 'nonres'
 TML_CHECK_POSTONLY = 'post'
@@ -258,6 +355,21 @@ class IPasswordUtility(zope.interface.Interface):
         dissimilarity between the new and old password.
         """
 
+    def check(new, ref=None):
+        """Check whether the new password is valid, without raising.
+
+        Returns ``None`` for a valid password, otherwise the
+        ``InvalidPassword`` exception ``verify()`` would raise. This is
+        cheaper than catching the exception, e.g. in loops and batches.
+        """
+
+    def verifyAll(new, ref=None):
+        """Return the errors of all rules the new password violates.
+
+        The list is empty for a valid password. Its first error is the one
+        ``verify()`` raises.
+        """
+
     def generate(ref=None):
         """Generate a valid password.
 
@@ -266,6 +378,41 @@ class IPasswordUtility(zope.interface.Interface):
         dissimilarity between the new and old password.
         """
 
+    def generateMany(n, refs=None):
+        """Generate ``n`` valid passwords.
+
+        Returns an iterator producing the passwords lazily, so that the setup
+        work is shared by all of them.
+
+        The optional ``refs`` argument is an iterable of reference passwords,
+        one for each password to generate (see ``generate()``). When it
+        yields less than ``n`` reference passwords, fewer passwords are
+        generated.
+        """
+
+
+class IPasswordSimilarity(zope.interface.Interface):
+    """Component computing the similarity of two passwords."""
+
+    def ratio(new, ref, maxSimilarity=None):
+        """Return the similarity ratio of the passwords, between 0 and 1.
+
+        When ``maxSimilarity`` is given, the exact ratio is only required
+        when it exceeds ``maxSimilarity``. Otherwise any value not exceeding
+        ``maxSimilarity`` may be returned, which allows to stop early.
+        """
+
+
+class IPasswordStrength(zope.interface.Interface):
+    """Component estimating how hard a password is to guess."""
+
+    def entropy(new):
+        """Return the estimated strength of the password in bits.
+
+        A strength of ``n`` bits means that about ``2 ** n`` guesses are
+        needed to find the password.
+        """
+
 
 class IHighSecurityPasswordUtility(IPasswordUtility):
     """A password utility for very secure passwords."""
@@ -333,7 +480,7 @@ class IHighSecurityPasswordUtility(IPasswordUtility):
         required=False,
         default=None)
 
-    # WARNING! generating a password with Others is not yet supported
+    # Generating passwords with others needs others in ``extraCharacters``.
     minOthers = zope.schema.Int(
         title=_('Minimum Number of Other characters'),
         description=_('The minimum amount of other characters that a '
@@ -420,6 +567,179 @@ class IHighSecurityPasswordUtility(IPasswordUtility):
                     "Minimum unique characters length must not be greater"
                     " than the maximum length.")
 
+    unicodeGroups = zope.schema.Bool(
+        title=_('Unicode Character Groups'),
+        description=_('Classify the characters outside of ASCII by their '
+                      'Unicode category: lowercase and uppercase letters, '
+                      'digits, and punctuation and symbols as specials. '
+                      'Otherwise they are all other characters.'),
+        required=False,
+        default=False)
+
+    normalization = zope.schema.Choice(
+        title=_('Unicode Normalization'),
+        description=_('The Unicode normalization form applied to the '
+                      'passwords before they are verified, e.g. NFKC.'),
+        values=('NFC', 'NFKC', 'NFD', 'NFKD'),
+        required=False,
+        default=None)
+
+    extraCharacters = zope.schema.TextLine(
+        title=_('Extra Characters'),
+        description=_('Characters drawn by generated passwords in addition '
+                      'to the ASCII ones, each in its group. Generating '
+                      'passwords with other characters needs some of '
+                      'them.'),
+        required=False,
+        default=None)
+
+    minEntropyBits = zope.schema.Int(
+        title=_('Minimum Strength'),
+        description=_('The minimum strength in bits that a password must '
+                      'have, as estimated from the words, keyboard walks, '
+                      'sequences and repeats it contains.'),
+        required=False,
+        min=1,
+        default=None)
+
+
+class ILoginFailureStore(zope.interface.Interface):
+    """Storage of the failed login attempts of principals.
+
+    Keeping the failed attempts out of the principals avoids writing to the
+    principals on failed logins and allows to share the failures between
+    processes. The principals are identified by a key, usually their login.
+    """
+
+    def get(key):
+        """Return the failed attempts and the time of the last one.
+
+        Returns ``(0, None)`` when no failure was recorded.
+        """
+
+    def recordFailure(key, when):
+        """Count a failed attempt that happened at ``when``."""
+
+    def setLastFailedAttempt(key, when):
+        """Set the time of the last failed attempt without counting one."""
+
+    def reset(key):
+        """Forget the failed attempts."""
+
+
+class ICredentialCache(zope.interface.Interface):
+    """Cache of recently verified credentials of principals.
+
+    A hit saves checking the password with the password manager, which is
+    slow for salted hashes. The credentials are only kept as keyed MAC, never
+    as plain text. The principals are identified by a key, usually their
+    login.
+    """
+
+    hits = zope.interface.Attribute('The number of found credentials.')
+
+    misses = zope.interface.Attribute(
+        'The number of credentials not found or expired.')
+
+    def isVerified(key, managerName, encoded, password):
+        """Return whether the ``password`` was recently verified against the
+        ``encoded`` password of the password manager ``managerName``."""
+
+    def remember(key, managerName, encoded, password):
+        """Remember successfully verified credentials."""
+
+    def invalidate(key):
+        """Forget the verified credentials of a principal."""
+
+    def clear():
+        """Forget all verified credentials."""
+
+
+class IWindowedLoginFailureStore(ILoginFailureStore):
+    """A login failure store keeping the times of the recent failures.
+
+    It allows to count the failures within a sliding window of time, see
+    ``failureWindow``. It also counts the failures of source addresses.
+    """
+
+    def getWithin(key, window):
+        """Return the amount of failed attempts within the time delta
+        ``window`` up to the last recorded one, and the time of the last
+        failed attempt, recorded or set by ``setLastFailedAttempt()``.
+
+        Returns ``(0, None)`` when no failure was recorded.
+        """
+
+    def capacityOf(key):
+        """Return the maximum amount of failed attempts of ``key`` that
+        ``getWithin()`` counts.
+
+        Principals refuse to check passwords unless it is more than their
+        maximum of failed attempts within the window, which could not be
+        reached otherwise.
+        """
+
+
+CHECK_SUCCESS = 'success'
+CHECK_FAILURE = 'failure'
+CHECK_LOCKED = 'locked'
+CHECK_TOO_MANY_FAILURES = 'tooManyFailures'
+CHECK_EXPIRED = 'expired'
+
+
+class IPasswordMonitor(zope.interface.Interface):
+    """Component recording the ``checkPassword()`` calls of principals.
+
+    Principals report their checks to the monitor named by their
+    ``passwordMonitorName``. Without a name they are not timed at all.
+    """
+
+    def checked(principal, outcome, timings):
+        """Record a finished ``checkPassword()`` call.
+
+        The ``outcome`` is one of the ``CHECK_*`` constants. The ``timings``
+        map the phases of the check to their durations in seconds: ``hash``
+        for checking the password hash, missing when a locked account was
+        rejected before, ``options`` for resolving the
+        options, ``policy`` for the lockout and expiration logic and
+        ``total``.
+        """
+
+
+class IPasswordCheckedEvent(zope.interface.Interface):
+    """A ``checkPassword()`` call finished."""
+
+    principal = zope.interface.Attribute('The checked principal.')
+
+    outcome = zope.interface.Attribute('One of the ``CHECK_*`` constants.')
+
+    timings = zope.interface.Attribute(
+        'The durations of the phases of the check, in seconds.')
+
+
+class IRequestClassifier(zope.interface.Interface):
+    """Component deciding whether a request counts failed logins.
+
+    Register it as named utility and use its name as ``failedAttemptCheck``.
+    It is called at most once per request and failed attempt check.
+    """
+
+    def isRelevant(request):
+        """Return whether failed logins of the request are counted and
+        locked accounts are refused."""
+
+
+@zope.interface.provider(zope.schema.interfaces.IContextSourceBinder)
+def failedAttemptCheckVocabulary(context):
+    """The vocabulary of the ``TML_CHECK_*`` constants and the names of the
+    registered ``IRequestClassifier`` utilities."""
+    values = [TML_CHECK_ALL, TML_CHECK_NONRESOURCE, TML_CHECK_POSTONLY]
+    for name, classifier in sorted(zope.component.getUtilitiesFor(
+            IRequestClassifier)):
+        if name not in values:
+            values.append(name)
+    return zope.schema.vocabulary.SimpleVocabulary.fromValues(values)
+
 
 class IPasswordOptionsUtility(zope.interface.Interface):
     """Different general security options.
@@ -461,9 +781,10 @@ class IPasswordOptionsUtility(zope.interface.Interface):
     failedAttemptCheck = zope.schema.Choice(
         title=_('Failed password check method'),
         description=_('Failed password check method. '
-                      'All requests, non-reqource requests, POST requests.'),
+                      'All requests, non-resource requests, POST requests '
+                      'or the name of a request classifier.'),
         required=False,
-        values=[TML_CHECK_ALL, TML_CHECK_NONRESOURCE, TML_CHECK_POSTONLY],
+        source=failedAttemptCheckVocabulary,
         default=TML_CHECK_ALL)
 
     disallowPasswordReuse = zope.schema.Bool(
@@ -471,3 +792,42 @@ class IPasswordOptionsUtility(zope.interface.Interface):
         description=_('Do not allow to set a previously set password again.'),
         required=False,
         default=False)
+
+    passwordHistoryLength = zope.schema.Int(
+        title=_('Password history length'),
+        description=_('The number of previous passwords that cannot be '
+                      'set again. All of them if not set.'),
+        required=False,
+        min=1,
+        default=None)
+
+    failureWindow = zope.schema.Int(
+        title=_('Failure window'),
+        description=_(
+            'Number of minutes in which the maximum number of failed '
+            'attempts must happen to lock the account. All failures since '
+            'the last successful login count if not set. Needs a login '
+            'failure store keeping the times of the failures.'),
+        required=False,
+        min=1,
+        default=None)
+
+    maxFailedAttemptsPerAddress = zope.schema.Int(
+        title=_('Max. number of failed password entries per address'),
+        description=_(
+            'Specifies the amount of failed attempts from one source address '
+            'within the failure window, for any principal, after which the '
+            'logins from this address are refused for the failure window.'),
+        required=False,
+        min=1,
+        default=None)
+
+    fastRejectLocked = zope.schema.Bool(
+        title=_('Reject locked accounts without checking the password'),
+        description=_(
+            'Refuse the logins of locked accounts within the lockout period '
+            'before the password is checked, which saves the password '
+            'hashing on attacks. The attempts refused this way do not '
+            'extend the lockout period.'),
+        required=False,
+        default=False)
@@ -0,0 +1,279 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Login Failure Store Implementations
+"""
+import array
+import collections
+import datetime
+import os
+import sqlite3
+import threading
+
+import zope.interface
+
+from z3c.password import interfaces
+
+
+@zope.interface.implementer(interfaces.ILoginFailureStore)
+class MemoryLoginFailureStore:
+    """A login failure store keeping the failures in memory.
+
+    The failures are shared by all threads of the process, but not between
+    processes, and are lost on restart.
+    """
+
+    def __init__(self):
+        self._failures = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        '''See interfaces.ILoginFailureStore'''
+        return self._failures.get(key, (0, None))
+
+    def recordFailure(self, key, when):
+        '''See interfaces.ILoginFailureStore'''
+        with self._lock:
+            attempts, last = self._failures.get(key, (0, None))
+            self._failures[key] = (attempts + 1, when)
+
+    def setLastFailedAttempt(self, key, when):
+        '''See interfaces.ILoginFailureStore'''
+        with self._lock:
+            attempts, last = self._failures.get(key, (0, None))
+            self._failures[key] = (attempts, when)
+
+    def reset(self, key):
+        '''See interfaces.ILoginFailureStore'''
+        with self._lock:
+            self._failures.pop(key, None)
+
+
+@zope.interface.implementer(interfaces.ILoginFailureStore)
+class SQLiteLoginFailureStore:
+    """A login failure store keeping the failures in an SQLite database.
+
+    All processes using the same database file share the failures. Every
+    change is committed immediately, independent of any transaction. Put
+    the file on a memory file system, like ``/dev/shm``, to avoid disk
+    writes.
+    """
+
+    def __init__(self, path, timeout=5.0):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connection().execute(
+            'CREATE TABLE IF NOT EXISTS login_failures ('
+            ' key TEXT PRIMARY KEY,'
+            ' attempts INTEGER NOT NULL,'
+            ' last TEXT)')
+
+    def _connection(self):
+        # Connections must neither be shared by threads nor survive a fork.
+        pid, connection = getattr(self._local, 'connection', (None, None))
+        if pid != os.getpid():
+            connection = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            self._local.connection = (os.getpid(), connection)
+        return connection
+
+    def get(self, key):
+        '''See interfaces.ILoginFailureStore'''
+        row = self._connection().execute(
+            'SELECT attempts, last FROM login_failures WHERE key = ?',
+            (key,)).fetchone()
+        if row is None:
+            return 0, None
+        attempts, last = row
+        if last is not None:
+            last = datetime.datetime.fromisoformat(last)
+        return attempts, last
+
+    def recordFailure(self, key, when):
+        '''See interfaces.ILoginFailureStore'''
+        self._connection().execute(
+            'INSERT INTO login_failures (key, attempts, last)'
+            ' VALUES (?, 1, ?)'
+            ' ON CONFLICT (key) DO UPDATE'
+            ' SET attempts = attempts + 1, last = excluded.last',
+            (key, when.isoformat()))
+
+    def setLastFailedAttempt(self, key, when):
+        '''See interfaces.ILoginFailureStore'''
+        self._connection().execute(
+            'INSERT INTO login_failures (key, attempts, last)'
+            ' VALUES (?, 0, ?)'
+            ' ON CONFLICT (key) DO UPDATE SET last = excluded.last',
+            (key, when.isoformat()))
+
+    def reset(self, key):
+        '''See interfaces.ILoginFailureStore'''
+        self._connection().execute(
+            'DELETE FROM login_failures WHERE key = ?', (key,))
+
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+class FailureWindow:
+    """A ring buffer of the times of the last failures of a key.
+
+    The times are seconds since the epoch. Recording a failure overwrites the
+    oldest one once ``capacity`` failures are recorded, but ``total`` counts
+    all of them. The time of the last failed attempt that was not counted,
+    like one on a locked account, is kept apart in ``touched``, so that it
+    does not move the window.
+    """
+
+    __slots__ = ('times', 'next', 'count', 'total', 'touched')
+
+    def __init__(self, capacity):
+        self.times = array.array('d', bytes(8 * capacity))
+        self.next = 0
+        self.count = 0
+        self.total = 0
+        self.touched = None
+
+    def add(self, seconds):
+        self.total += 1
+        self.times[self.next] = seconds
+        self.next = (self.next + 1) % len(self.times)
+        if self.count < len(self.times):
+            self.count += 1
+
+    def newest(self):
+        """The time of the newest recorded failure."""
+        if not self.count:
+            return None
+        # a negative index wraps around
+        return self.times[self.next - 1]
+
+    def last(self):
+        """The time of the last failed attempt, recorded or touched."""
+        newest = self.newest()
+        if newest is None or self.touched is None:
+            return newest
+        return max(newest, self.touched)
+
+    def touch(self, seconds):
+        if self.count:
+            self.touched = seconds
+
+    def since(self, seconds):
+        # count from the newest failure until the first older one
+        count = 0
+        index = self.next
+        while count < self.count:
+            index -= 1
+            if self.times[index] < seconds:
+                break
+            count += 1
+        return count
+
+
+@zope.interface.implementer(interfaces.IWindowedLoginFailureStore)
+class SlidingWindowLoginFailureStore:
+    """A login failure store keeping the times of the last failures in
+    memory, so that they can be counted within a sliding window.
+
+    The times of at most ``capacity`` failures are kept per key, which must
+    be more than the maximum number of failed attempts within the window.
+    The failures of at most ``maxKeys`` keys are kept, the ones of the keys
+    failing least recently are dropped first. The keys of the source
+    addresses, like ``('address', '192.0.2.1')``, are kept apart, at most
+    ``maxAddressKeys`` of them with ``addressCapacity`` failures each, so
+    that failing from many addresses does not drop the failures of locked
+    principals. Recording a failure takes constant time.
+
+    The failures are shared by all threads of the process, but not between
+    processes, and are lost on restart.
+    """
+
+    def __init__(self, capacity=16, maxKeys=100000, maxAddressKeys=100000,
+                 addressCapacity=None):
+        self.capacity = capacity
+        self.maxKeys = maxKeys
+        self.maxAddressKeys = maxAddressKeys
+        if addressCapacity is None:
+            addressCapacity = capacity
+        self.addressCapacity = addressCapacity
+        self._windows = collections.OrderedDict()
+        self._addressWindows = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def _isAddress(self, key):
+        return isinstance(key, tuple) and key[:1] == ('address',)
+
+    def _windowsOf(self, key):
+        """The windows holding the key and their maximum size."""
+        if self._isAddress(key):
+            return self._addressWindows, self.maxAddressKeys
+        return self._windows, self.maxKeys
+
+    def _time(self, seconds):
+        if seconds is None:
+            return None
+        return _EPOCH + datetime.timedelta(seconds=seconds)
+
+    def get(self, key):
+        '''See interfaces.ILoginFailureStore'''
+        with self._lock:
+            window = self._windowsOf(key)[0].get(key)
+            if window is None:
+                return 0, None
+            return window.total, self._time(window.last())
+
+    def getWithin(self, key, window):
+        '''See interfaces.IWindowedLoginFailureStore'''
+        with self._lock:
+            failures = self._windowsOf(key)[0].get(key)
+            if failures is None:
+                return 0, None
+            # The window ends at the newest recorded failure, failed
+            # attempts that were not counted do not move it.
+            count = failures.since(
+                failures.newest() - window.total_seconds())
+            return count, self._time(failures.last())
+
+    def capacityOf(self, key):
+        '''See interfaces.IWindowedLoginFailureStore'''
+        if self._isAddress(key):
+            return self.addressCapacity
+        return self.capacity
+
+    def recordFailure(self, key, when):
+        '''See interfaces.ILoginFailureStore'''
+        with self._lock:
+            windows, maxKeys = self._windowsOf(key)
+            window = windows.get(key)
+            if window is None:
+                window = windows[key] = FailureWindow(self.capacityOf(key))
+                if len(windows) > maxKeys:
+                    windows.popitem(last=False)
+            else:
+                windows.move_to_end(key)
+            window.add((when - _EPOCH).total_seconds())
+
+    def setLastFailedAttempt(self, key, when):
+        '''See interfaces.ILoginFailureStore'''
+        with self._lock:
+            window = self._windowsOf(key)[0].get(key)
+            if window is not None:
+                window.touch((when - _EPOCH).total_seconds())
+
+    def reset(self, key):
+        '''See interfaces.ILoginFailureStore'''
+        with self._lock:
+            self._windowsOf(key)[0].pop(key, None)
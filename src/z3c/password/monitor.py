@@ -0,0 +1,101 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Password Check Monitor Implementations
+"""
+import bisect
+import collections
+import threading
+
+import zope.event
+import zope.interface
+
+from z3c.password import interfaces
+
+
+class Histogram:
+    """A histogram of durations with fixed, exponential buckets.
+
+    The upper bounds of the buckets double from one microsecond up to about
+    a minute. Longer durations are counted in a last, open bucket.
+    """
+
+    bounds = tuple(2 ** exponent / 1e6 for exponent in range(27))
+
+    def __init__(self):
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, seconds):
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def buckets(self):
+        """Return ``(upperBound, count)`` for each non-empty bucket.
+
+        The upper bound of the last, open bucket is ``None``.
+        """
+        bounds = self.bounds + (None,)
+        return [(bound, count)
+                for bound, count in zip(bounds, self.counts) if count]
+
+
+@zope.interface.implementer(interfaces.IPasswordMonitor)
+class PasswordMonitor:
+    """A monitor counting the outcomes and collecting histograms of the
+    phase durations of ``checkPassword()``.
+
+    The monitor is shared by all threads, so it should be registered as
+    global utility.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def checked(self, principal, outcome, timings):
+        '''See interfaces.IPasswordMonitor'''
+        with self._lock:
+            self.counters[outcome] += 1
+            for phase, seconds in timings.items():
+                histogram = self.histograms.get(phase)
+                if histogram is None:
+                    histogram = self.histograms[phase] = Histogram()
+                histogram.add(seconds)
+
+    def reset(self):
+        """Forget all recorded checks."""
+        with self._lock:
+            self.counters = collections.Counter()
+            self.histograms = {}
+
+
+@zope.interface.implementer(interfaces.IPasswordCheckedEvent)
+class PasswordCheckedEvent:
+    """A ``checkPassword()`` call finished."""
+
+    def __init__(self, principal, outcome, timings):
+        self.principal = principal
+        self.outcome = outcome
+        self.timings = timings
+
+
+@zope.interface.implementer(interfaces.IPasswordMonitor)
+class EventPasswordMonitor:
+    """A monitor notifying a ``PasswordCheckedEvent`` for each check."""
+
+    def checked(self, principal, outcome, timings):
+        '''See interfaces.IPasswordMonitor'''
+        zope.event.notify(PasswordCheckedEvent(principal, outcome, timings))
@@ -13,15 +13,60 @@
 ##############################################################################
 """Password Utility Implementation
 """
-import difflib
+import itertools
+import math
 import random
 import string
 import time
+import unicodedata
 
 import zope.interface
+import zope.schema
 from zope.schema.fieldproperty import FieldProperty
 
 from z3c.password import interfaces
+from z3c.password.securerandom import SecureRandom
+from z3c.password.similarity import DifflibSimilarity
+from z3c.password.strength import PatternStrength
+
+
+def checkWith(utility, new, ref=None):
+    """Return the error of the password utility for the password, ``None``
+    if it is valid.
+
+    Password utilities written before ``check()`` was added to
+    ``IPasswordUtility`` only implement ``verify()``, which is called then.
+    """
+    check = getattr(utility, 'check', None)
+    if check is not None:
+        return check(new, ref)
+    try:
+        utility.verify(new, ref)
+    except zope.schema.ValidationError as error:
+        return error
+    return None
+
+
+def verifyAllWith(utility, new, ref=None):
+    """Return the errors of all rules of the password utility violated by
+    the password, like ``checkWith()`` for older password utilities."""
+    verifyAll = getattr(utility, 'verifyAll', None)
+    if verifyAll is not None:
+        return verifyAll(new, ref)
+    error = checkWith(utility, new, ref)
+    return [] if error is None else [error]
+
+
+def generateManyWith(utility, n, refs=None):
+    """Return an iterator over ``n`` passwords generated by the password
+    utility, calling ``generate()`` for each of them for password utilities
+    written before ``generateMany()`` was added to ``IPasswordUtility``."""
+    generateMany = getattr(utility, 'generateMany', None)
+    if generateMany is not None:
+        return generateMany(n, refs)
+    if refs is None:
+        refs = itertools.repeat(None, n)
+    return (utility.generate(ref) for ref in itertools.islice(refs, n))
 
 
 @zope.interface.implementer(interfaces.IPasswordUtility)
@@ -35,57 +80,246 @@ class TrivialPasswordUtility:
         '''See interfaces.IPasswordUtility'''
         return
 
+    def check(self, new, ref=None):
+        '''See interfaces.IPasswordUtility'''
+        return None
+
+    def verifyAll(self, new, ref=None):
+        '''See interfaces.IPasswordUtility'''
+        return []
+
     def generate(self, ref=None):
         '''See interfaces.IPasswordUtility'''
         return 'trivial'
 
+    def generateMany(self, n, refs=None):
+        '''See interfaces.IPasswordUtility'''
+        return itertools.repeat('trivial', n)
+
+
+class PolicyFieldProperty(FieldProperty):
+    """A field property invalidating the compiled policy when it is set."""
+
+    def __set__(self, inst, value):
+        super().__set__(inst, value)
+        inst._v_compiledPolicy = None
+
+
+class UnicodeGroupTable(dict):
+    """A translation table classifying the characters outside of ASCII that
+    are missing in it by their Unicode category.
+
+    Lowercase letters, uppercase and titlecase letters, decimal digits and
+    punctuation and symbols map to the marker of their group, any other
+    character to itself. Each character is classified once and then kept,
+    so the lookup stays a dictionary access. At most ``maxSize`` characters
+    are kept, so that large inputs cannot grow the table without bound;
+    beyond that the characters are classified on each lookup.
+    """
+
+    maxSize = 4096
+
+    def __init__(self, table, markers):
+        super().__init__(table)
+        self.limit = len(self) + self.maxSize
+        lower, upper, digits, specials = markers
+        self.categories = {
+            'Ll': lower, 'Lu': upper, 'Lt': upper, 'Nd': digits,
+            'Pc': specials, 'Pd': specials, 'Ps': specials, 'Pe': specials,
+            'Pi': specials, 'Pf': specials, 'Po': specials,
+            'Sm': specials, 'Sc': specials, 'Sk': specials, 'So': specials}
+
+    def __missing__(self, code):
+        marker = code
+        if code >= 128:
+            marker = self.categories.get(
+                unicodedata.category(chr(code)), code)
+        if len(self) < self.limit:
+            self[code] = marker
+        return marker
+
+
+class CompiledPolicy:
+    """The policy of a high-security password utility, compiled for speed.
+
+    The characters of the groups are compiled into a translation table
+    mapping every character to a marker character of its group. Counting the
+    characters of each group then only needs one translation and a count per
+    group, both done in C. With ``unicodeGroups`` the table is a
+    ``UnicodeGroupTable``.
+    """
+
+    def __init__(self, utility):
+        self.groups = (utility.LOWERLETTERS, utility.UPPERLETTERS,
+                       utility.DIGITS, utility.SPECIALS)
+        self.markers = tuple(group[0] for group in self.groups)
+        table = {}
+        # Iterate backwards, so that the first group wins for characters
+        # that are in several groups.
+        for group, marker in reversed(tuple(zip(self.groups, self.markers))):
+            table.update(dict.fromkeys(map(ord, group), marker))
+        if utility.unicodeGroups:
+            table = UnicodeGroupTable(table, self.markers)
+        self.table = table
+        self.normalization = utility.normalization
+        # The alphabets of the generated passwords: the groups and the others,
+        # with the extra characters added to their group.
+        self.alphabets = self._alphabets(utility.extraCharacters or '')
+        self.letters = frozenset(utility.LOWERLETTERS + utility.UPPERLETTERS)
+        # For ASCII passwords the unique letters can be taken from the whole
+        # lowercased password, if that does not mix letters and others.
+        self.lowerLetters = frozenset(char.lower() for char in self.letters)
+        self.asciiFast = all(
+            (chr(code) in self.letters)
+            == (chr(code).lower() in self.lowerLetters)
+            for code in range(128))
+
+        self.minLength = utility.minLength
+        self.maxLength = utility.maxLength
+        self.groupMax = utility.groupMax
+        self.minimums = (utility.minLowerLetter, utility.minUpperLetter,
+                         utility.minDigits, utility.minSpecials,
+                         utility.minOthers)
+        self.minUniqueCharacters = utility.minUniqueCharacters
+        self.minUniqueLetters = utility.minUniqueLetters
+        self.minEntropyBits = utility.minEntropyBits
+        # The generation plan, computed on first use.
+        self.plan = None
+
+    def groupOf(self, char):
+        """The index of the group of the character, 4 for the others."""
+        code = char.translate(self.table)
+        for idx, marker in enumerate(self.markers):
+            if code == marker:
+                return idx
+        return 4
+
+    def _alphabets(self, extra):
+        alphabets = [list(group) for group in self.groups] + [[]]
+        for char in dict.fromkeys(extra):
+            idx = self.groupOf(char)
+            if idx < 4 and char in self.groups[idx]:
+                continue
+            # Only letters with one letter of the other case are generated,
+            # since the letters are made unique case-insensitively.
+            if idx == 0 and char.upper().lower() != char:
+                continue
+            if idx == 1 and char.lower().upper() != char:
+                continue
+            alphabets[idx].append(char)
+        return tuple(''.join(alphabet) for alphabet in alphabets)
+
+    def count(self, new):
+        """Count the characters of the password.
+
+        Returns the amount of characters in each group, including the others,
+        followed by the amount of unique characters and unique letters, all
+        taken lowercase.
+        """
+        codes = new.translate(self.table)
+        lower, upper, digits, specials = self.markers
+        lower = codes.count(lower)
+        upper = codes.count(upper)
+        digits = codes.count(digits)
+        specials = codes.count(specials)
+        others = len(new) - lower - upper - digits - specials
+        if self.asciiFast and new.isascii():
+            unique = set(new.lower())
+            uniqueLetters = len(unique & self.lowerLetters)
+        else:
+            unique = {char.lower() for char in set(new)}
+            letters = self.markers[:2]
+            uniqueLetters = len({char.lower()
+                                 for char, code in zip(new, codes)
+                                 if code in letters})
+        return (lower, upper, digits, specials, others,
+                len(unique), uniqueLetters)
+
 
 @zope.interface.implementer(interfaces.IHighSecurityPasswordUtility)
 class HighSecurityPasswordUtility:
     """An implementation of the high-security password API."""
 
-    minLength = FieldProperty(
+    minLength = PolicyFieldProperty(
         interfaces.IHighSecurityPasswordUtility['minLength'])
-    maxLength = FieldProperty(
+    maxLength = PolicyFieldProperty(
         interfaces.IHighSecurityPasswordUtility['maxLength'])
-    groupMax = FieldProperty(
+    groupMax = PolicyFieldProperty(
         interfaces.IHighSecurityPasswordUtility['groupMax'])
-    maxSimilarity = FieldProperty(
+    maxSimilarity = PolicyFieldProperty(
         interfaces.IHighSecurityPasswordUtility['maxSimilarity'])
-    minLowerLetter = FieldProperty(
+    minLowerLetter = PolicyFieldProperty(
         interfaces.IHighSecurityPasswordUtility['minLowerLetter'])
-    minUpperLetter = FieldProperty(
+    minUpperLetter = PolicyFieldProperty(
         interfaces.IHighSecurityPasswordUtility['minUpperLetter'])
-    minDigits = FieldProperty(
+    minDigits = PolicyFieldProperty(
         interfaces.IHighSecurityPasswordUtility['minDigits'])
-    minSpecials = FieldProperty(
+    minSpecials = PolicyFieldProperty(
         interfaces.IHighSecurityPasswordUtility['minSpecials'])
-    minOthers = FieldProperty(
+    minOthers = PolicyFieldProperty(
         interfaces.IHighSecurityPasswordUtility['minOthers'])
-    minUniqueCharacters = FieldProperty(
+    minUniqueCharacters = PolicyFieldProperty(
         interfaces.IHighSecurityPasswordUtility['minUniqueCharacters'])
-    minUniqueLetters = FieldProperty(
+    minUniqueLetters = PolicyFieldProperty(
         interfaces.IHighSecurityPasswordUtility['minUniqueLetters'])
+    minEntropyBits = PolicyFieldProperty(
+        interfaces.IHighSecurityPasswordUtility['minEntropyBits'])
+    unicodeGroups = PolicyFieldProperty(
+        interfaces.IHighSecurityPasswordUtility['unicodeGroups'])
+    normalization = PolicyFieldProperty(
+        interfaces.IHighSecurityPasswordUtility['normalization'])
+    extraCharacters = PolicyFieldProperty(
+        interfaces.IHighSecurityPasswordUtility['extraCharacters'])
 
     LOWERLETTERS = string.ascii_letters[:26]
     UPPERLETTERS = string.ascii_letters[26:]
     DIGITS = string.digits
     SPECIALS = string.punctuation
 
+    # The component computing the similarity to the reference password,
+    # providing ``IPasswordSimilarity``.
+    similarity = DifflibSimilarity()
+
+    # The component estimating the strength for ``minEntropyBits``,
+    # providing ``IPasswordStrength``.
+    strength = PatternStrength()
+
+    # The amount of passwords generated before giving up on a reference
+    # password that is too similar to every one of them.
+    maxGenerateAttempts = 100
+
+    # An optional ``profiling.PolicyStatistics`` recording the rejections,
+    # the verification stage durations and the generation attempts.
+    statistics = None
+
     description = ('Passwords generated and verified by this utility conform '
                    'strictly to the specified parameters. See the interface '
                    'for more details.')
 
+    _v_compiledPolicy = None
+
+    # Whether ``random`` was seeded to reproduce the passwords. Otherwise a
+    # Mersenne Twister stored by an older version is replaced when loaded.
+    seeded = False
+
     def __init__(self, minLength=8, maxLength=12, groupMax=6,
                  maxSimilarity=0.6, seed=None,
                  minLowerLetter=None, minUpperLetter=None, minDigits=None,
                  minSpecials=None, minOthers=None,
-                 minUniqueCharacters=None, minUniqueLetters=None):
+                 minUniqueCharacters=None, minUniqueLetters=None,
+                 minEntropyBits=None, unicodeGroups=False,
+                 normalization=None, extraCharacters=None):
         self.minLength = minLength
         self.maxLength = maxLength
         self.groupMax = groupMax
         self.maxSimilarity = maxSimilarity
-        self.random = random.Random(seed or time.time())
+        # Passwords are generated from a seed only to reproduce them, e.g.
+        # in tests.
+        if seed is None:
+            self.random = SecureRandom()
+        else:
+            self.random = random.Random(seed)
+            self.seeded = True
         self.minLowerLetter = minLowerLetter
         self.minUpperLetter = minUpperLetter
         self.minDigits = minDigits
@@ -93,118 +327,368 @@ class HighSecurityPasswordUtility:
         self.minOthers = minOthers
         self.minUniqueCharacters = minUniqueCharacters
         self.minUniqueLetters = minUniqueLetters
+        self.minEntropyBits = minEntropyBits
+        self.unicodeGroups = unicodeGroups
+        self.normalization = normalization
+        self.extraCharacters = extraCharacters
+
+    def __getstate__(self):
+        # the compiled policy is compiled again after loading
+        state = self.__dict__.copy()
+        state.pop('_v_compiledPolicy', None)
+        return state
+
+    def __setstate__(self, state):
+        # states stored by older versions may hold an outdated policy
+        state = dict(state)
+        state.pop('_v_compiledPolicy', None)
+        # and a Mersenne Twister seeded with the time, which is predictable
+        if (not state.get('seeded')
+                and type(state.get('random')) is random.Random):
+            state['random'] = SecureRandom()
+        self.__dict__.update(state)
+
+    @property
+    def compiledPolicy(self):
+        """The compiled policy, rebuilt when a policy field changes."""
+        policy = self._v_compiledPolicy
+        if policy is None:
+            policy = self._v_compiledPolicy = CompiledPolicy(self)
+        return policy
 
     def _checkSimilarity(self, new, ref):
-        similarity = difflib.SequenceMatcher(None, new, ref).ratio()
+        if self.maxSimilarity is None:
+            return None
+        similarity = self.similarity.ratio(new, ref, self.maxSimilarity)
         if similarity > self.maxSimilarity:
-            raise interfaces.TooSimilarPassword(
+            return interfaces.TooSimilarPassword(
                 similarity=similarity, maxSimilarity=self.maxSimilarity)
+        return None
 
     def verify(self, new, ref=None):
         '''See interfaces.IHighSecurityPasswordUtility'''
+        error = self.check(new, ref)
+        if error is not None:
+            raise error
+
+    def check(self, new, ref=None):
+        '''See interfaces.IHighSecurityPasswordUtility'''
+        statistics = self.statistics
+        if statistics is None:
+            return next(self._violations(new, ref), None)
+        timings = {}
+        error = next(self._violations(new, ref, timings), None)
+        statistics.recordCheck(() if error is None else (error,), timings)
+        return error
+
+    def verifyAll(self, new, ref=None):
+        '''See interfaces.IHighSecurityPasswordUtility'''
+        statistics = self.statistics
+        if statistics is None:
+            return list(self._violations(new, ref))
+        timings = {}
+        errors = list(self._violations(new, ref, timings))
+        statistics.recordCheck(errors, timings)
+        return errors
+
+    def _violations(self, new, ref, timings=None):
+        # Yield the violated rules in the order of verification, so the
+        # first one is the error ``verify()`` raises. The durations of the
+        # costly stages are stored in ``timings`` if given.
+        policy = self.compiledPolicy
         # 0. Make sure we got a password.
         if not new:
-            raise interfaces.NoPassword()
+            yield interfaces.NoPassword()
+            return
+        if policy.normalization is not None:
+            new = unicodedata.normalize(policy.normalization, new)
+            if ref is not None:
+                ref = unicodedata.normalize(policy.normalization, ref)
         # 1. Make sure the password has the right length.
-        if len(new) < self.minLength:
-            raise interfaces.TooShortPassword(minLength=self.minLength)
-        if len(new) > self.maxLength:
-            raise interfaces.TooLongPassword(maxLength=self.maxLength)
+        if policy.minLength is not None and len(new) < policy.minLength:
+            yield interfaces.TooShortPassword(minLength=policy.minLength)
+        # The other rules are skipped for too long passwords, whose length
+        # is not bounded, so that their costs are bounded.
+        if policy.maxLength is not None and len(new) > policy.maxLength:
+            yield interfaces.TooLongPassword(maxLength=policy.maxLength)
+            return
         # 2. Ensure that the password is sufficiently different to the old
         #    one.
         if ref is not None:
-            self._checkSimilarity(new, ref)
+            if timings is None:
+                error = self._checkSimilarity(new, ref)
+            else:
+                start = time.perf_counter()
+                error = self._checkSimilarity(new, ref)
+                timings['similarity'] = time.perf_counter() - start
+            if error is not None:
+                yield error
         # 3. Ensure that the password's character set is complex enough.
-        num_lower_letters = 0
-        num_upper_letters = 0
-        num_digits = 0
-        num_specials = 0
-        num_others = 0
-        uniqueChars = set()
-        uniqueLetters = set()
-        for char in new:
-            uniqueChars.add(char.lower())
-            if char in self.LOWERLETTERS:
-                num_lower_letters += 1
-                uniqueLetters.add(char.lower())
-            elif char in self.UPPERLETTERS:
-                num_upper_letters += 1
-                uniqueLetters.add(char.lower())
-            elif char in self.DIGITS:
-                num_digits += 1
-            elif char in self.SPECIALS:
-                num_specials += 1
+        if timings is None:
+            counts = policy.count(new)
+        else:
+            start = time.perf_counter()
+            counts = policy.count(new)
+            timings['characters'] = time.perf_counter() - start
+        (num_lower_letters, num_upper_letters, num_digits, num_specials,
+         num_others, uniqueChars, uniqueLetters) = counts
+        if (policy.groupMax is not None
+                and max(num_lower_letters, num_upper_letters, num_digits,
+                        num_specials, num_others) > policy.groupMax):
+            yield interfaces.TooManyGroupCharacters(
+                groupMax=policy.groupMax)
+
+        (minLowerLetter, minUpperLetter, minDigits, minSpecials,
+         minOthers) = policy.minimums
+
+        if (minLowerLetter is not None
+                and num_lower_letters < minLowerLetter):
+            yield interfaces.TooFewGroupCharactersLowerLetter(
+                minLowerLetter=minLowerLetter)
+
+        if (minUpperLetter is not None
+                and num_upper_letters < minUpperLetter):
+            yield interfaces.TooFewGroupCharactersUpperLetter(
+                minUpperLetter=minUpperLetter)
+
+        if (minDigits is not None
+                and num_digits < minDigits):
+            yield interfaces.TooFewGroupCharactersDigits(
+                minDigits=minDigits)
+
+        if (minSpecials is not None
+                and num_specials < minSpecials):
+            yield interfaces.TooFewGroupCharactersSpecials(
+                minSpecials=minSpecials)
+
+        if (minOthers is not None
+                and num_others < minOthers):
+            yield interfaces.TooFewGroupCharactersOthers(
+                minOthers=minOthers)
+
+        if (policy.minUniqueCharacters is not None
+                and uniqueChars < policy.minUniqueCharacters):
+            yield interfaces.TooFewUniqueCharacters(
+                minUniqueCharacters=policy.minUniqueCharacters)
+
+        if (policy.minUniqueLetters is not None
+                and uniqueLetters < policy.minUniqueLetters):
+            yield interfaces.TooFewUniqueLetters(
+                minUniqueLetters=policy.minUniqueLetters)
+
+        # 4. Ensure that the password is hard enough to guess.
+        if policy.minEntropyBits is not None:
+            if timings is None:
+                bits = self.strength.entropy(new)
             else:
-                num_others += 1
-        if (num_lower_letters > self.groupMax or
-            num_upper_letters > self.groupMax or
-            num_digits > self.groupMax or
-            num_specials > self.groupMax or
-                num_others > self.groupMax):
-            raise interfaces.TooManyGroupCharacters(
-                groupMax=self.groupMax)
-
-        if (self.minLowerLetter is not None
-                and num_lower_letters < self.minLowerLetter):
-            raise interfaces.TooFewGroupCharactersLowerLetter(
-                minLowerLetter=self.minLowerLetter)
-
-        if (self.minUpperLetter is not None
-                and num_upper_letters < self.minUpperLetter):
-            raise interfaces.TooFewGroupCharactersUpperLetter(
-                minUpperLetter=self.minUpperLetter)
-
-        if (self.minDigits is not None
-                and num_digits < self.minDigits):
-            raise interfaces.TooFewGroupCharactersDigits(
-                minDigits=self.minDigits)
-
-        if (self.minSpecials is not None
-                and num_specials < self.minSpecials):
-            raise interfaces.TooFewGroupCharactersSpecials(
-                minSpecials=self.minSpecials)
-
-        if (self.minOthers is not None
-                and num_others < self.minOthers):
-            raise interfaces.TooFewGroupCharactersOthers(
-                minOthers=self.minOthers)
-
-        if (self.minUniqueCharacters is not None
-                and len(uniqueChars) < self.minUniqueCharacters):
-            raise interfaces.TooFewUniqueCharacters(
-                minUniqueCharacters=self.minUniqueCharacters)
-
-        if (self.minUniqueLetters is not None
-                and len(uniqueLetters) < self.minUniqueLetters):
-            raise interfaces.TooFewUniqueLetters(
-                minUniqueLetters=self.minUniqueLetters)
+                start = time.perf_counter()
+                bits = self.strength.entropy(new)
+                timings['strength'] = time.perf_counter() - start
+            if bits < policy.minEntropyBits:
+                yield interfaces.TooWeakPassword(
+                    entropyBits=bits, minEntropyBits=policy.minEntropyBits)
 
-        return
+    def _generationPlan(self):
+        """Compute the length range and the group minimums to generate.
 
-    def generate(self, ref=None):
-        '''See interfaces.IHighSecurityPasswordUtility'''
-        verified = False
-        while not verified:
-            new = ''
-            # Determine the length of the password
-            length = self.random.randint(self.minLength, self.maxLength)
-
-            # Generate the password
-            chars = self.LOWERLETTERS + self.UPPERLETTERS + \
-                self.DIGITS + self.SPECIALS
-
-            for count in range(length):
-                new += self.random.choice(chars)
-
-            # Verify the new password
-            try:
-                self.verify(new, ref)
-            except interfaces.InvalidPassword:
-                verified = False
+        Raises a ``ValueError`` when the policy cannot be satisfied by a
+        generated password.
+        """
+        groups = self.compiledPolicy.alphabets
+        lowerLetters, upperLetters, digits, specials, others = groups
+        if self.minOthers and not others:
+            raise ValueError(
+                'Generating passwords with other characters needs other '
+                'characters in extraCharacters.')
+        mins = [self.minLowerLetter or 0, self.minUpperLetter or 0,
+                self.minDigits or 0, self.minSpecials or 0,
+                self.minOthers or 0]
+        uniqueLetters = self.minUniqueLetters or 0
+        uniqueChars = self.minUniqueCharacters or 0
+        letters = max(mins[0] + mins[1], uniqueLetters)
+
+        # Characters beyond the size of their alphabet are repeats.
+        repeats = max(letters - len(lowerLetters), 0) \
+            + max(mins[2] - len(digits), 0) \
+            + max(mins[3] - len(specials), 0) \
+            + max(mins[4] - len(others), 0)
+
+        lo = max(self.minLength or 1, letters + sum(mins[2:]),
+                 uniqueChars + repeats)
+        hi = self.maxLength if self.maxLength is not None else lo
+        groupMax = self.groupMax if self.groupMax is not None else hi
+        hi = min(hi, groupMax * len([group for group in groups if group]))
+        if (lo > hi
+                or letters > groupMax * 2
+                or uniqueLetters > len(lowerLetters)
+                or uniqueChars > min(groupMax * 2, len(lowerLetters))
+                + min(groupMax, len(digits))
+                + min(groupMax, len(specials))
+                + min(groupMax, len(others))):
+            raise ValueError(
+                'The password policy cannot be satisfied by a generated '
+                'password.')
+        if self.minEntropyBits is not None:
+            lo = self._strongLength(lo, hi, groups)
+        return lo, hi, groups, mins
+
+    def _strongLength(self, lo, hi, groups):
+        """The minimum length of generated passwords with ``minEntropyBits``.
+
+        Random characters rarely form patterns, so their strength is about
+        the sum of the strengths of the single characters. The length is
+        raised until the average characters reach the strength, with one
+        character to spare. Raises a ``ValueError`` when the average
+        characters cannot reach it within ``maxLength``, so that most of
+        the generated passwords would be too weak.
+        """
+        entropy = self.strength.entropy
+        bits = [entropy(char) for alphabet in groups for char in alphabet]
+        average = sum(bits) / len(bits)
+        if average * hi < self.minEntropyBits:
+            raise ValueError(
+                'Generated passwords cannot reach the minimum strength of '
+                '%s bits within the maximum length.' % self.minEntropyBits)
+        length = math.ceil(self.minEntropyBits / average) + 1
+        return min(max(lo, length), hi)
+
+    def _draw(self, alphabet, count):
+        """Draw ``count`` characters of the alphabet at once, if the random
+        number generator supports it."""
+        chars = getattr(self.random, 'chars', None)
+        if chars is None:
+            return [self.random.choice(alphabet) for idx in range(count)]
+        return list(chars(alphabet, count))
+
+    def _stream(self, alphabet):
+        """Iterate over characters drawn from the alphabet."""
+        stream = getattr(self.random, 'stream', None)
+        if stream is None:
+            return map(self.random.choice, itertools.repeat(alphabet))
+        return stream(alphabet)
+
+    def _diversify(self, picks, alphabet, count):
+        """Replace repeated picks by unused characters of the alphabet.
+
+        Repeats are replaced until ``picks`` holds ``count`` distinct
+        characters or the alphabet is exhausted.
+        """
+        seen = set()
+        repeats = []
+        for idx, char in enumerate(picks):
+            if char in seen:
+                repeats.append(idx)
             else:
-                verified = True
+                seen.add(char)
+        missing = min(count - len(seen), len(repeats))
+        if missing <= 0:
+            return
+        unused = [char for char in alphabet if char not in seen]
+        missing = min(missing, len(unused))
+        for idx, char in zip(repeats, self.random.sample(unused, missing)):
+            picks[idx] = char
+
+    def _diversifyLetters(self, lower, upper, alphabet, count):
+        """Like ``_diversify()``, but for letters of either case."""
+        letters = lower + [char.lower() for char in upper]
+        self._diversify(letters, alphabet, count)
+        lower[:] = letters[:len(lower)]
+        upper[:] = [char.upper() for char in letters[len(lower):]]
+
+    def _construct(self, plan):
+        """Build one password conforming to the plan in a single pass."""
+        lo, hi, groups, mins = plan
+        length = self.random.randint(lo, hi)
+        groupMax = self.groupMax if self.groupMax is not None else length
+        uniqueChars = self.minUniqueCharacters or 0
+        choice = self.random.choice
+
+        # 1. Draw the minimum amount of characters of each group, then
+        #    enough letters for the unique letters.
+        picks = [self._draw(alphabet, minimum)
+                 for alphabet, minimum in zip(groups, mins)]
+        lower, upper, digits, specials, others = picks
+        for count in range((self.minUniqueLetters or 0)
+                           - len(lower) - len(upper)):
+            idx = choice([idx for idx in (0, 1)
+                          if len(picks[idx]) < groupMax])
+            picks[idx].append(choice(groups[idx]))
+
+        # 2. Draw the rest from all groups that are not full yet. As long as
+        #    unique characters are missing, the characters drawn so far are
+        #    made unique and unused characters are preferred. Letters count
+        #    case-insensitively.
+        if uniqueChars:
+            self._diversifyLetters(
+                lower, upper, groups[0], len(lower) + len(upper))
+            self._diversify(digits, groups[2], len(digits))
+            self._diversify(specials, groups[3], len(specials))
+            self._diversify(others, groups[4], len(others))
+        used = {char.lower() for group in picks for char in group}
+        remaining = length - sum(len(group) for group in picks)
+        while remaining > 0:
+            available = [idx for idx in range(len(groups))
+                         if groups[idx] and len(picks[idx]) < groupMax]
+            chars = ''.join(groups[idx] for idx in available)
+            stream = self._stream(chars)
+            while remaining > 0:
+                if len(used) < uniqueChars:
+                    unused = [char for char in chars
+                              if char.lower() not in used]
+                    char = choice(unused or chars)
+                    used.add(char.lower())
+                else:
+                    char = next(stream)
+                for idx in available:
+                    if char in groups[idx]:
+                        break
+                picks[idx].append(char)
+                remaining -= 1
+                if len(picks[idx]) == groupMax:
+                    break
+
+        # 3. Replace repeated letters until there are enough unique ones.
+        self._diversifyLetters(
+            lower, upper, groups[0], self.minUniqueLetters or 0)
+
+        chars = lower + upper + digits + specials + others
+        self.random.shuffle(chars)
+        return ''.join(chars)
+
+    def _generate(self, plan, ref):
+        # The constructed password conforms to all constraints but the
+        # similarity to the reference password and the minimum strength,
+        # which need another try.
+        for count in range(self.maxGenerateAttempts - 1):
+            new = self._construct(plan)
+            if self.check(new, ref) is None:
+                if self.statistics is not None:
+                    self.statistics.recordGenerate(count + 1)
+                return new
+        new = self._construct(plan)
+        self.verify(new, ref)
+        if self.statistics is not None:
+            self.statistics.recordGenerate(self.maxGenerateAttempts)
         return new
 
+    def _plan(self):
+        policy = self.compiledPolicy
+        if policy.plan is None:
+            policy.plan = self._generationPlan()
+        return policy.plan
+
+    def generate(self, ref=None):
+        '''See interfaces.IHighSecurityPasswordUtility'''
+        return self._generate(self._plan(), ref)
+
+    def generateMany(self, n, refs=None):
+        '''See interfaces.IHighSecurityPasswordUtility'''
+        plan = self._plan()
+        if refs is None:
+            refs = itertools.repeat(None, n)
+        return (self._generate(plan, ref)
+                for ref in itertools.islice(refs, n))
+
 
 @zope.interface.implementer(interfaces.IPasswordOptionsUtility)
 class PasswordOptionsUtility:
@@ -222,15 +706,31 @@ class PasswordOptionsUtility:
         interfaces.IPasswordOptionsUtility['disallowPasswordReuse'])
     failedAttemptCheck = FieldProperty(
         interfaces.IPasswordOptionsUtility['failedAttemptCheck'])
+    passwordHistoryLength = FieldProperty(
+        interfaces.IPasswordOptionsUtility['passwordHistoryLength'])
+    fastRejectLocked = FieldProperty(
+        interfaces.IPasswordOptionsUtility['fastRejectLocked'])
+    failureWindow = FieldProperty(
+        interfaces.IPasswordOptionsUtility['failureWindow'])
+    maxFailedAttemptsPerAddress = FieldProperty(
+        interfaces.IPasswordOptionsUtility['maxFailedAttemptsPerAddress'])
 
     def __init__(self, changePasswordOnNextLogin=None,
                  passwordExpiresAfter=None,
                  lockOutPeriod=None, maxFailedAttempts=None,
                  disallowPasswordReuse=None,
-                 failedAttemptCheck=None):
+                 failedAttemptCheck=None,
+                 passwordHistoryLength=None,
+                 fastRejectLocked=None,
+                 failureWindow=None,
+                 maxFailedAttemptsPerAddress=None):
         self.changePasswordOnNextLogin = changePasswordOnNextLogin
         self.passwordExpiresAfter = passwordExpiresAfter
         self.lockOutPeriod = lockOutPeriod
         self.maxFailedAttempts = maxFailedAttempts
         self.disallowPasswordReuse = disallowPasswordReuse
         self.failedAttemptCheck = failedAttemptCheck
+        self.passwordHistoryLength = passwordHistoryLength
+        self.fastRejectLocked = fastRejectLocked
+        self.failureWindow = failureWindow
+        self.maxFailedAttemptsPerAddress = maxFailedAttemptsPerAddress
@@ -13,13 +13,111 @@
 ##############################################################################
 """Principal MixIn for Advanced Password Management
 """
+import concurrent.futures
 import datetime
+import functools
+import time
 
 import persistent.list
 import zope.component
+from zope.password.interfaces import IPasswordManager
+from zope.security.interfaces import NoInteraction
 from zope.security.management import getInteraction
 
 from z3c.password import interfaces
+from z3c.password import relevance
+
+
+@functools.lru_cache(maxsize=64)
+def _days(days):
+    return datetime.timedelta(days=days)
+
+
+@functools.lru_cache(maxsize=64)
+def _minutes(minutes):
+    return datetime.timedelta(minutes=minutes)
+
+
+class PasswordOptions:
+    """The password options of a principal, resolved at once.
+
+    Options set on the principal take priority over the ones of the options
+    utility. The utility is looked up only once, and not at all when all
+    options are set on the principal. The login failure store and the
+    credential cache are looked up only when the principal names one.
+    """
+
+    def __init__(self, principal):
+        utility = None
+        if (principal.passwordExpiresAfter is None
+                or principal.lockOutPeriod is None
+                or principal.failedAttemptCheck is None
+                or principal.maxFailedAttempts is None
+                or principal.disallowPasswordReuse is None
+                or principal.passwordHistoryLength is None
+                or principal.fastRejectLocked is None
+                or principal.failureWindow is None
+                or principal.maxFailedAttemptsPerAddress is None):
+            utility = principal._optionsUtility()
+
+        self.passwordExpiresAfter = principal.passwordExpiresAfter
+        self.lockOutPeriod = principal.lockOutPeriod
+        self.failedAttemptCheck = principal.failedAttemptCheck
+        self.maxFailedAttempts = principal.maxFailedAttempts
+        self.disallowPasswordReuse = principal.disallowPasswordReuse
+        self.passwordHistoryLength = principal.passwordHistoryLength
+        self.fastRejectLocked = principal.fastRejectLocked
+        self.failureWindow = principal.failureWindow
+        self.maxFailedAttemptsPerAddress = (
+            principal.maxFailedAttemptsPerAddress)
+        self.loginFailureStore = None
+        if principal.loginFailureStoreName is not None:
+            self.loginFailureStore = zope.component.getUtility(
+                interfaces.ILoginFailureStore,
+                name=principal.loginFailureStoreName)
+        self.credentialCache = None
+        if principal.credentialCacheName is not None:
+            self.credentialCache = zope.component.getUtility(
+                interfaces.ICredentialCache,
+                name=principal.credentialCacheName)
+        if utility is None:
+            return
+
+        if (self.passwordExpiresAfter is None
+                and utility.passwordExpiresAfter is not None):
+            self.passwordExpiresAfter = _days(utility.passwordExpiresAfter)
+        if (self.lockOutPeriod is None
+                and utility.lockOutPeriod is not None):
+            self.lockOutPeriod = _minutes(utility.lockOutPeriod)
+        if self.failedAttemptCheck is None:
+            self.failedAttemptCheck = utility.failedAttemptCheck
+        if self.maxFailedAttempts is None:
+            self.maxFailedAttempts = utility.maxFailedAttempts
+        if self.disallowPasswordReuse is None:
+            self.disallowPasswordReuse = utility.disallowPasswordReuse
+        if self.passwordHistoryLength is None:
+            self.passwordHistoryLength = utility.passwordHistoryLength
+        if self.fastRejectLocked is None:
+            self.fastRejectLocked = utility.fastRejectLocked
+        if (self.failureWindow is None
+                and utility.failureWindow is not None):
+            self.failureWindow = _minutes(utility.failureWindow)
+        if self.maxFailedAttemptsPerAddress is None:
+            self.maxFailedAttemptsPerAddress = (
+                utility.maxFailedAttemptsPerAddress)
+
+
+def _checkCapacity(store, key, maximum):
+    # A windowed store counts at most ``capacityOf(key)`` failures within
+    # the window, a larger maximum would never lock or throttle.
+    if maximum is None:
+        return
+    capacity = store.capacityOf(key)
+    if capacity <= maximum:
+        raise ValueError(
+            'The login failure store counts at most %i failures of %r within'
+            ' the failure window, it must be more than the maximum of %i.'
+            % (capacity, key, maximum))
 
 
 class PrincipalMixIn:
@@ -36,27 +134,113 @@ class PrincipalMixIn:
     maxFailedAttempts = None
     lastFailedAttempt = None
     lockOutPeriod = None
+    # reject locked accounts without checking the password
+    fastRejectLocked = None
+    # The time delta in which the maximum of failures must happen, needs a
+    # login failure store providing ``IWindowedLoginFailureStore``.
+    failureWindow = None
+    # refuse the logins from source addresses failing too often
+    maxFailedAttemptsPerAddress = None
 
     disallowPasswordReuse = None
     previousPasswords = None
+    passwordHistoryLength = None
+    # An executor (``concurrent.futures``) checking the previous passwords
+    # in parallel, e.g. a ``ThreadPoolExecutor``.
+    passwordHistoryExecutor = None
 
     passwordOptionsUtilityName = None
 
+    # The name of the ``ILoginFailureStore`` keeping the failed attempts
+    # instead of ``failedAttempts`` and ``lastFailedAttempt``.
+    loginFailureStoreName = None
+
+    # The name of the ``IPasswordMonitor`` recording the password checks.
+    passwordMonitorName = None
+
+    # The name of the ``ICredentialCache`` remembering verified passwords.
+    credentialCacheName = None
+
+    # The options resolved for the running ``checkPassword()`` or
+    # ``setPassword()`` call, so that the hooks find them.
+    _v_passwordOptions = None
+
+    def _passwordHistory(self):
+        # The ``(passwordManagerName, encodedPassword)`` entries of the
+        # previous passwords, newest first. Entries stored before the
+        # manager name was recorded are encoded passwords only.
+        history = self.previousPasswords or ()
+        length = self._passwordHistoryLength()
+        if length is not None:
+            history = history[-length:]
+        for entry in reversed(history):
+            if isinstance(entry, tuple):
+                yield entry
+            else:
+                yield self.passwordManagerName, entry
+
+    def _getHistoryPasswordManager(self, name):
+        if name == self.passwordManagerName:
+            # hack, but this should work with zope.app.authentication and
+            # z3c.authenticator
+            return self._getPasswordManager()
+        return zope.component.queryUtility(IPasswordManager, name)
+
     def _checkDisallowedPreviousPassword(self, password):
         if self._disallowPasswordReuse():
             if self.previousPasswords is not None and password is not None:
-                # hack, but this should work with zope.app.authentication and
-                # z3c.authenticator
-                passwordManager = self._getPasswordManager()
-
-                for pwd in self.previousPasswords:
-                    if passwordManager.checkPassword(pwd, password):
-                        raise interfaces.PreviousPasswordNotAllowed(self)
+                managers = {}
+                seen = set()
+                checks = []
+                for entry in self._passwordHistory():
+                    if entry in seen:
+                        continue
+                    seen.add(entry)
+                    name, encoded = entry
+                    if name not in managers:
+                        managers[name] = self._getHistoryPasswordManager(
+                            name)
+                    # an entry of a no longer available manager cannot match
+                    if managers[name] is not None:
+                        checks.append((managers[name], encoded))
+
+                if self._previousPasswordUsed(password, checks):
+                    raise interfaces.PreviousPasswordNotAllowed(self)
+
+    def _previousPasswordUsed(self, password, checks):
+        executor = self.passwordHistoryExecutor
+        if executor is None or len(checks) < 2:
+            return any(manager.checkPassword(encoded, password)
+                       for manager, encoded in checks)
+
+        # The newest password is the most likely to be reused, so check it
+        # right away and the remaining ones in parallel.
+        manager, encoded = checks[0]
+        if manager.checkPassword(encoded, password):
+            return True
+        futures = [executor.submit(manager.checkPassword, encoded, password)
+                   for manager, encoded in checks[1:]]
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                if future.result():
+                    return True
+        finally:
+            for future in futures:
+                future.cancel()
+        return False
 
     def getPassword(self):
         return super().getPassword()
 
     def setPassword(self, password, passwordManagerName=None):
+        options = self._passwordOptions()
+        held = self._holdPasswordOptions(options)
+        try:
+            self._setPassword(password, passwordManagerName, options)
+        finally:
+            self._releasePasswordOptions(held)
+
+    def _setPassword(self, password, passwordManagerName, options):
         self._checkDisallowedPreviousPassword(password)
 
         super().setPassword(password, passwordManagerName)
@@ -68,12 +252,15 @@ class PrincipalMixIn:
             if self.password is not None:
                 # storm/custom property does not like a simple append
                 ppwd = self.previousPasswords
-                ppwd.append(self.password)
+                ppwd.append((self.passwordManagerName, self.password))
+                length = self._passwordHistoryLength()
+                if length is not None and len(ppwd) > length:
+                    del ppwd[:-length]
                 self.previousPasswords = ppwd
 
+        self._forgetCredentials(options)
         self.passwordSetOn = self.now()
-        self.failedAttempts = 0
-        self.lastFailedAttempt = None
+        self._resetLoginFailures(options)
         self.passwordExpired = False
 
     password = property(getPassword, setPassword)
@@ -82,6 +269,93 @@ class PrincipalMixIn:
         # hook to facilitate testing and easier override
         return datetime.datetime.now()
 
+    def _loginFailureKey(self):
+        return self.login
+
+    def _credentialKey(self):
+        return self.login
+
+    def _checkCredentials(self, pwd, options):
+        cache = options.credentialCache
+        if cache is None or pwd is None:
+            return super().checkPassword(pwd)
+        key = self._credentialKey()
+        credentials = (self.passwordManagerName, self.getPassword(), pwd)
+        if cache.isVerified(key, *credentials):
+            return True
+        same = super().checkPassword(pwd)
+        if same:
+            cache.remember(key, *credentials)
+        return same
+
+    def _forgetCredentials(self, options):
+        if options.credentialCache is not None:
+            options.credentialCache.invalidate(self._credentialKey())
+
+    def _getLoginFailures(self, options=None):
+        if options is None:
+            options = self._passwordOptions()
+        store = options.loginFailureStore
+        if store is None:
+            return self.failedAttempts, self.lastFailedAttempt
+        if (options.failureWindow is not None
+                and interfaces.IWindowedLoginFailureStore.providedBy(store)):
+            return store.getWithin(
+                self._loginFailureKey(), options.failureWindow)
+        return store.get(self._loginFailureKey())
+
+    def _sourceAddress(self):
+        # hook to take the address from a header set by a proxy
+        environment = getattr(self._request(), 'environment', None)
+        if environment is None:
+            return None
+        return environment.get('REMOTE_ADDR')
+
+    def _addressFailureKey(self, options):
+        # The key of the failures of the source address in the login
+        # failure store, ``None`` if the address is not throttled.
+        if (options.failureWindow is None
+                or not interfaces.IWindowedLoginFailureStore.providedBy(
+                    options.loginFailureStore)):
+            return None
+        address = self._sourceAddress()
+        if not address:
+            return None
+        return ('address', address)
+
+    def _recordLoginFailure(self, options):
+        store = options.loginFailureStore
+        if store is None:
+            self.failedAttempts += 1
+            self.lastFailedAttempt = self.now()
+        else:
+            store.recordFailure(self._loginFailureKey(), self.now())
+
+    def _setLastFailedAttempt(self, options):
+        store = options.loginFailureStore
+        if store is None:
+            self.lastFailedAttempt = self.now()
+        else:
+            store.setLastFailedAttempt(self._loginFailureKey(), self.now())
+
+    def _resetLoginFailures(self, options):
+        store = options.loginFailureStore
+        if store is None:
+            self.failedAttempts = 0
+            self.lastFailedAttempt = None
+        else:
+            store.reset(self._loginFailureKey())
+
+    def _request(self):
+        try:
+            interaction = getInteraction()
+        except NoInteraction:
+            return None
+        try:
+            return interaction.participations[0]
+        except IndexError:
+            return None
+
     def _isRelevantRequest(self):
         fac = self._failedAttemptCheck()
         if fac is None:
@@ -90,35 +364,117 @@ class PrincipalMixIn:
         if fac == interfaces.TML_CHECK_ALL:
             return True
 
-        interaction = getInteraction()
-        try:
-            request = interaction.participations[0]
-        except IndexError:
+        request = self._request()
+        if request is None:
             return True  # no request, we regard that as relevant.
 
-        if fac == interfaces.TML_CHECK_NONRESOURCE:
-            if '/@@/' in request.getURL():
-                return False
-            return True
-
-        if fac == interfaces.TML_CHECK_POSTONLY:
-            if request.method == 'POST':
-                return True
-            return False
+        return relevance.isRelevantRequest(request, fac)
 
     def checkPassword(self, pwd, ignoreExpiration=False, ignoreFailures=False):
         # keep this as fast as possible, because it will be called (usually)
         # for EACH request
+        if self.passwordMonitorName is None:
+            return self._checkPassword(pwd, ignoreExpiration, ignoreFailures)
+        return self._monitoredCheckPassword(
+            pwd, ignoreExpiration, ignoreFailures)
+
+    def _monitoredCheckPassword(self, pwd, ignoreExpiration, ignoreFailures):
+        monitor = zope.component.getUtility(
+            interfaces.IPasswordMonitor, name=self.passwordMonitorName)
+        timings = {}
+        # unexpected errors are not recorded
+        outcome = None
+        start = time.perf_counter()
+        try:
+            same = self._checkPassword(
+                pwd, ignoreExpiration, ignoreFailures, timings)
+            if same:
+                outcome = interfaces.CHECK_SUCCESS
+            else:
+                outcome = interfaces.CHECK_FAILURE
+            return same
+        except interfaces.AccountLocked:
+            outcome = interfaces.CHECK_LOCKED
+            raise
+        except interfaces.TooManyLoginFailures:
+            outcome = interfaces.CHECK_TOO_MANY_FAILURES
+            raise
+        except interfaces.PasswordExpired:
+            outcome = interfaces.CHECK_EXPIRED
+            raise
+        finally:
+            if outcome is not None:
+                total = time.perf_counter() - start
+                timings['total'] = total
+                # a fast rejected check did not hash
+                timings['policy'] = (
+                    total - timings.get('hash', 0.0) - timings['options'])
+                monitor.checked(self, outcome, timings)
+
+    def _checkPassword(self, pwd, ignoreExpiration, ignoreFailures,
+                       timings=None):
+        # Resolve the options once for all checks below.
+        if timings is None:
+            options = self._passwordOptions()
+        else:
+            start = time.perf_counter()
+            options = self._passwordOptions()
+            timings['options'] = time.perf_counter() - start
+        held = self._holdPasswordOptions(options)
+        try:
+            return self._checkResolvedPassword(
+                pwd, ignoreExpiration, ignoreFailures, options, timings)
+        finally:
+            self._releasePasswordOptions(held)
 
-        # Check the password
-        same = super().checkPassword(pwd)
-
+    def _checkResolvedPassword(self, pwd, ignoreExpiration, ignoreFailures,
+                               options, timings):
         # Do not try to record failed attempts or raise account locked
         # errors for requests that are irrelevant in this regard.
-        if not self._isRelevantRequest():
+        relevant = self._isRelevantRequest()
+
+        if (relevant and options.failureWindow is not None
+                and interfaces.IWindowedLoginFailureStore.providedBy(
+                    options.loginFailureStore)):
+            _checkCapacity(
+                options.loginFailureStore, self._loginFailureKey(),
+                self._maxFailedAttempts())
+
+        addressKey = None
+        if relevant and options.maxFailedAttemptsPerAddress is not None:
+            addressKey = self._addressFailureKey(options)
+            if addressKey is not None:
+                _checkCapacity(
+                    options.loginFailureStore, addressKey,
+                    options.maxFailedAttemptsPerAddress)
+            if addressKey is not None and not ignoreFailures:
+                failures, last = options.loginFailureStore.getWithin(
+                    addressKey, options.failureWindow)
+                if (failures >= options.maxFailedAttemptsPerAddress
+                        and last + options.failureWindow > self.now()):
+                    raise interfaces.TooManyAddressFailures(
+                        self, addressKey[1])
+
+        if relevant and options.fastRejectLocked and not ignoreFailures:
+            # Do not spend the hashing on a locked account. The attempt is
+            # not checked, so it does not extend the lockout period.
+            if self._lockedBeforeHashing(options):
+                self._forgetCredentials(options)
+                raise interfaces.AccountLocked(self)
+
+        # Check the password
+        if timings is None:
+            same = self._checkCredentials(pwd, options)
+        else:
+            start = time.perf_counter()
+            same = self._checkCredentials(pwd, options)
+            timings['hash'] = time.perf_counter() - start
+
+        if not relevant:
             return same
 
-        if not ignoreFailures and self.lastFailedAttempt is not None:
+        failedAttempts, lastFailedAttempt = self._getLoginFailures(options)
+        if not ignoreFailures and lastFailedAttempt is not None:
             if self.tooManyLoginFailures():
                 locked = self.accountLocked()
                 if locked is None:
@@ -128,45 +484,56 @@ class PrincipalMixIn:
                     # account locked by tooManyLoginFailures and within
                     # lockPeriod
                     if not same:
-                        self.lastFailedAttempt = self.now()
+                        self._setLastFailedAttempt(options)
+                    self._forgetCredentials(options)
                     raise interfaces.AccountLocked(self)
                 else:
                     # account locked by tooManyLoginFailures and out of
                     # lockPeriod
-                    self.failedAttempts = 0
-                    self.lastFailedAttempt = None
+                    self._resetLoginFailures(options)
+                    failedAttempts = 0
 
         if same:
             # successful attempt
             if not ignoreExpiration:
                 if self.passwordExpired:
+                    self._forgetCredentials(options)
                     raise interfaces.PasswordExpired(self)
 
                 # Make sure the password has not been expired
                 expiresOn = self.passwordExpiresOn()
                 if expiresOn is not None:
                     if expiresOn < self.now():
+                        self._forgetCredentials(options)
                         raise interfaces.PasswordExpired(self)
             add = 0
         else:
             # failed attempt, record it, increase counter
-            self.failedAttempts += 1
-            self.lastFailedAttempt = self.now()
+            self._recordLoginFailure(options)
+            if addressKey is not None:
+                options.loginFailureStore.recordFailure(
+                    addressKey, self.now())
             add = 1
 
         # If the maximum amount of failures has been reached notify the
         # system by raising an error.
         if not ignoreFailures:
             if self.tooManyLoginFailures(add):
+                self._forgetCredentials(options)
                 raise interfaces.TooManyLoginFailures(self)
 
-        if same and self.failedAttempts != 0:
+        if same and failedAttempts != 0:
             # if all nice and good clear failure counter
-            self.failedAttempts = 0
-            self.lastFailedAttempt = None
+            self._resetLoginFailures(options)
 
         return same
 
+    def _lockedBeforeHashing(self, options):
+        failedAttempts, lastFailedAttempt = self._getLoginFailures(options)
+        return (lastFailedAttempt is not None
+                and self.tooManyLoginFailures()
+                and bool(self.accountLocked()))
+
     def tooManyLoginFailures(self, add=0):
         attempts = self._maxFailedAttempts()
         # this one needs to be >=, because... data just does not
@@ -176,7 +543,8 @@ class PrincipalMixIn:
         # at the same time
         if attempts is not None:
             attempts += add
-            if self.failedAttempts >= attempts:
+            failedAttempts, lastFailedAttempt = self._getLoginFailures()
+            if failedAttempts >= attempts:
                 return True
         return False
 
@@ -184,8 +552,9 @@ class PrincipalMixIn:
         lockPeriod = self._lockOutPeriod()
         if lockPeriod is not None:
             # check if the user locked himself
-            if (self.lastFailedAttempt is not None
-                    and self.lastFailedAttempt + lockPeriod > self.now()):
+            failedAttempts, lastFailedAttempt = self._getLoginFailures()
+            if (lastFailedAttempt is not None
+                    and lastFailedAttempt + lockPeriod > self.now()):
                 return True
             else:
                 return False
@@ -208,72 +577,201 @@ class PrincipalMixIn:
         return zope.component.queryUtility(
             interfaces.IPasswordOptionsUtility, default=None)
 
-    def _passwordExpiresAfter(self):
-        if self.passwordExpiresAfter is not None:
-            return self.passwordExpiresAfter
-
-        options = self._optionsUtility()
+    def _passwordOptions(self):
+        options = self._v_passwordOptions
         if options is None:
-            return self.passwordExpiresAfter
-        else:
-            days = options.passwordExpiresAfter
-            if days is not None:
-                return datetime.timedelta(days=days)
-            else:
-                return self.passwordExpiresAfter
+            options = PasswordOptions(self)
+        return options
+
+    def _holdPasswordOptions(self, options):
+        # Hold the options for the running call, so that the hooks below
+        # find them without resolving them again. Returns the options held
+        # before, for ``_releasePasswordOptions()``.
+        held = self._v_passwordOptions
+        self._v_passwordOptions = options
+        return held
+
+    def _releasePasswordOptions(self, held):
+        if held is not None:
+            self._v_passwordOptions = held
+            return
+        try:
+            del self._v_passwordOptions
+        except AttributeError:
+            # released by another thread
+            pass
 
-    def _lockOutPeriod(self):
-        if self.lockOutPeriod is not None:
-            return self.lockOutPeriod
+    def _passwordExpiresAfter(self):
+        return self._passwordOptions().passwordExpiresAfter
 
-        options = self._optionsUtility()
-        if options is None:
-            return self.lockOutPeriod
-        else:
-            minutes = options.lockOutPeriod
-            if minutes is not None:
-                return datetime.timedelta(minutes=minutes)
-            else:
-                return self.lockOutPeriod
+    def _lockOutPeriod(self):
+        return self._passwordOptions().lockOutPeriod
 
     def _failedAttemptCheck(self):
-        if self.failedAttemptCheck is not None:
-            return self.failedAttemptCheck
-
-        options = self._optionsUtility()
-        if options is None:
-            return self.failedAttemptCheck
-        else:
-            fac = options.failedAttemptCheck
-            if fac is not None:
-                return fac
-            else:
-                return self.failedAttemptCheck
+        return self._passwordOptions().failedAttemptCheck
 
     def _maxFailedAttempts(self):
-        if self.maxFailedAttempts is not None:
-            return self.maxFailedAttempts
-
-        options = self._optionsUtility()
-        if options is None:
-            return self.maxFailedAttempts
-        else:
-            count = options.maxFailedAttempts
-            if count is not None:
-                return count
-            else:
-                return self.maxFailedAttempts
+        return self._passwordOptions().maxFailedAttempts
 
     def _disallowPasswordReuse(self):
-        if self.disallowPasswordReuse is not None:
-            return self.disallowPasswordReuse
+        return self._passwordOptions().disallowPasswordReuse
 
-        options = self._optionsUtility()
-        if options is None:
-            return self.disallowPasswordReuse
-        else:
-            dpr = options.disallowPasswordReuse
-            if dpr is not None:
-                return dpr
-            else:
-                return self.disallowPasswordReuse
+    def _passwordHistoryLength(self):
+        return self._passwordOptions().passwordHistoryLength
+
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_SECOND = datetime.timedelta(seconds=1)
+
+
+@functools.lru_cache(maxsize=64)
+def _seconds(seconds):
+    return datetime.timedelta(seconds=seconds)
+
+
+def _toEpoch(value):
+    if value is None:
+        return None
+    return (value - _EPOCH) // _SECOND
+
+
+def _fromEpoch(value):
+    if value is None:
+        return None
+    return _EPOCH + datetime.timedelta(seconds=value)
+
+
+def _toSeconds(value):
+    if value is None:
+        return None
+    return value // _SECOND
+
+
+def _fromSeconds(value):
+    if value is None:
+        return None
+    return _seconds(value)
+
+
+class PasswordState:
+    """The password metadata of a principal in a compact form.
+
+    The date/times are seconds since the epoch and the periods are seconds,
+    so that sub-second precision is lost. The previous passwords are a tuple
+    of ``(passwordManagerName, encodedPassword)`` entries. A state is
+    pickled as a tuple of its values.
+    """
+
+    __slots__ = ('passwordSetOn', 'passwordExpired', 'failedAttempts',
+                 'lastFailedAttempt', 'previousPasswords',
+                 'passwordExpiresAfter', 'lockOutPeriod', 'maxFailedAttempts')
+
+    def __init__(self, passwordSetOn=None, passwordExpired=False,
+                 failedAttempts=0, lastFailedAttempt=None,
+                 previousPasswords=None, passwordExpiresAfter=None,
+                 lockOutPeriod=None, maxFailedAttempts=None):
+        self.passwordSetOn = passwordSetOn
+        self.passwordExpired = passwordExpired
+        self.failedAttempts = failedAttempts
+        self.lastFailedAttempt = lastFailedAttempt
+        self.previousPasswords = previousPasswords
+        self.passwordExpiresAfter = passwordExpiresAfter
+        self.lockOutPeriod = lockOutPeriod
+        self.maxFailedAttempts = maxFailedAttempts
+
+    def __reduce__(self):
+        return self.__class__, tuple(
+            getattr(self, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return '<{} {}>'.format(self.__class__.__name__, ' '.join(
+            '{}={!r}'.format(name, getattr(self, name))
+            for name in self.__slots__))
+
+
+def _stateProperty(name, load=None, dump=None):
+
+    def get(self):
+        value = getattr(self._readPasswordState(), name)
+        return value if load is None else load(value)
+
+    def set(self, value):
+        state = self._writePasswordState()
+        setattr(state, name, value if dump is None else dump(value))
+        # reassign, so that persistent principals register the change
+        self._passwordState = state
+
+    return property(get, set)
+
+
+def _loadHistory(value):
+    return None if value is None else list(value)
+
+
+def _dumpHistory(value):
+    return None if value is None else tuple(value)
+
+
+class CompactPrincipalMixIn(PrincipalMixIn):
+    """A ``PrincipalMixIn`` keeping its password metadata in a single
+    ``PasswordState`` instead of separate attributes.
+
+    ``previousPasswords`` is a new list on each access, assign it to change
+    the history.
+
+    Principals stored with the attributes of ``PrincipalMixIn`` can switch
+    to this class. Their attributes are read until the state is written the
+    first time, or ``migratePasswordState()`` is called.
+    """
+
+    _passwordState = None
+
+    passwordSetOn = _stateProperty('passwordSetOn', _fromEpoch, _toEpoch)
+    passwordExpired = _stateProperty('passwordExpired')
+    failedAttempts = _stateProperty('failedAttempts')
+    lastFailedAttempt = _stateProperty(
+        'lastFailedAttempt', _fromEpoch, _toEpoch)
+    previousPasswords = _stateProperty(
+        'previousPasswords', _loadHistory, _dumpHistory)
+    passwordExpiresAfter = _stateProperty(
+        'passwordExpiresAfter', _fromSeconds, _toSeconds)
+    lockOutPeriod = _stateProperty('lockOutPeriod', _fromSeconds, _toSeconds)
+    maxFailedAttempts = _stateProperty('maxFailedAttempts')
+
+    def _readPasswordState(self):
+        # accessing the attribute activates a persistent principal
+        state = self._passwordState
+        if state is None:
+            state = self._migratedPasswordState()
+        return state
+
+    def _writePasswordState(self):
+        state = self._passwordState
+        if state is None:
+            state = self._migratedPasswordState()
+            for name in PasswordState.__slots__:
+                self.__dict__.pop(name, None)
+        return state
+
+    def _migratedPasswordState(self):
+        # a state of the attributes stored by ``PrincipalMixIn``, if any
+        old = self.__dict__
+        return PasswordState(
+            _toEpoch(old.get('passwordSetOn')),
+            old.get('passwordExpired', False),
+            old.get('failedAttempts', 0),
+            _toEpoch(old.get('lastFailedAttempt')),
+            _dumpHistory(old.get('previousPasswords')),
+            _toSeconds(old.get('passwordExpiresAfter')),
+            _toSeconds(old.get('lockOutPeriod')),
+            old.get('maxFailedAttempts'))
+
+    def migratePasswordState(self):
+        """Move the password attributes into the ``PasswordState``.
+
+        Returns whether the principal was changed.
+        """
+        if self._passwordState is not None:
+            return False
+        self._passwordState = self._writePasswordState()
+        return True
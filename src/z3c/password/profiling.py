@@ -0,0 +1,165 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Password Policy Profiling and Analysis
+"""
+import collections
+import copy
+import random
+import threading
+
+from z3c.password import MessageFactory as _
+
+
+class PolicyStatistics:
+    """Statistics of the verifications and generations of a password utility.
+
+    Set an instance as ``statistics`` of a ``HighSecurityPasswordUtility``
+    to record:
+
+    - ``checks``: the amount of verified passwords,
+
+    - ``rejections``: the amount of rejections by the name of the error,
+
+    - ``times``: the total seconds spent in the ``similarity`` check, the
+      ``characters`` scan and the ``strength`` estimation,
+
+    - ``generated`` and ``attempts``: the amount of generated passwords and
+      of the passwords constructed for them, ``maxAttempts`` the most
+      constructed for one.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __getstate__(self):
+        # the lock cannot be pickled, e.g. with a persistent utility
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """Forget all recorded verifications and generations."""
+        self.checks = 0
+        self.rejections = collections.Counter()
+        self.times = collections.Counter()
+        self.generated = 0
+        self.attempts = 0
+        self.maxAttempts = 0
+
+    def recordCheck(self, errors, timings):
+        with self._lock:
+            self.checks += 1
+            for error in errors:
+                self.rejections[error.__class__.__name__] += 1
+            self.times.update(timings)
+
+    def recordGenerate(self, attempts):
+        with self._lock:
+            self.generated += 1
+            self.attempts += attempts
+            self.maxAttempts = max(self.maxAttempts, attempts)
+
+    @property
+    def attemptsPerPassword(self):
+        """The average amount of attempts per generated password."""
+        if not self.generated:
+            return None
+        return self.attempts / self.generated
+
+
+class PolicyAnalysis:
+    """The result of ``analyzePolicy()``."""
+
+    def __init__(self):
+        self.feasible = True
+        self.acceptance = None
+        self.rejections = collections.Counter()
+        self.generatedAcceptance = None
+        self.warnings = []
+
+    @property
+    def expectedAttempts(self):
+        """The expected amount of random passwords drawn per accepted one."""
+        if not self.acceptance:
+            return None
+        return 1 / self.acceptance
+
+
+def analyzePolicy(utility, samples=1000, ref=None, seed=None,
+                  minAcceptance=0.01):
+    """Estimate how hard it is to find a password valid for the policy of a
+    ``HighSecurityPasswordUtility``.
+
+    ``samples`` random passwords, of a random length within the length
+    limits, drawn uniformly from all characters of the groups, are verified.
+    The fraction of accepted ones is the ``acceptance``, which is how likely
+    a password drawn at random is valid, the violated rules are counted in
+    ``rejections``. With a reference password or a minimum strength,
+    ``generatedAcceptance`` is the fraction of the passwords constructed by
+    ``generate()`` that are dissimilar enough to it and strong enough,
+    which are the only reasons for ``generate()`` to try again.
+
+    The ``warnings`` explain a policy that cannot be satisfied by generated
+    passwords, or for which less than ``minAcceptance`` of the passwords are
+    accepted. The utility itself is not changed.
+    """
+    analysis = PolicyAnalysis()
+    # A copy drawing from its own random generator and not recording.
+    utility = copy.copy(utility)
+    utility.random = random.Random(seed)
+    utility.statistics = None
+
+    try:
+        lo, hi, groups, mins = utility._generationPlan()
+    except ValueError as error:
+        analysis.feasible = False
+        analysis.warnings.append(str(error))
+        lo = utility.minLength or 1
+        hi = max(lo, utility.maxLength or lo)
+
+    chars = ''.join(utility.compiledPolicy.alphabets)
+    accepted = 0
+    for count in range(samples):
+        length = utility.random.randint(lo, hi)
+        new = ''.join(utility.random.choice(chars) for idx in range(length))
+        errors = utility.verifyAll(new, ref)
+        if errors:
+            analysis.rejections.update(
+                error.__class__.__name__ for error in errors)
+        else:
+            accepted += 1
+    analysis.acceptance = accepted / samples
+    if analysis.acceptance < minAcceptance:
+        analysis.warnings.append(_(
+            'Only ${percent}% of random passwords satisfy the policy.',
+            mapping=dict(percent=round(analysis.acceptance * 100, 2))))
+
+    if analysis.feasible and (
+            ref is not None or utility.minEntropyBits is not None):
+        plan = utility._plan()
+        accepted = sum(
+            utility.check(utility._construct(plan), ref) is None
+            for count in range(samples))
+        analysis.generatedAcceptance = accepted / samples
+        if analysis.generatedAcceptance < minAcceptance:
+            analysis.warnings.append(_(
+                'Only ${percent}% of the generated passwords are accepted.',
+                mapping=dict(
+                    percent=round(analysis.generatedAcceptance * 100, 2))))
+    return analysis
@@ -0,0 +1,102 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Request Classifiers for the Failed Attempt Check
+"""
+import zope.component
+import zope.interface
+
+from z3c.password import interfaces
+
+
+# The key of the decisions cached in the request annotations.
+ANNOTATION_KEY = 'z3c.password.relevance'
+
+
+@zope.interface.implementer(interfaces.IRequestClassifier)
+class ResourceRequestClassifier:
+    """Requests for resources, having ``/@@/`` in their URL, are not
+    relevant."""
+
+    def isRelevant(self, request):
+        return '/@@/' not in request.getURL()
+
+
+@zope.interface.implementer(interfaces.IRequestClassifier)
+class MethodRequestClassifier:
+    """Only requests with one of the HTTP ``methods`` are relevant."""
+
+    def __init__(self, methods=('POST',)):
+        self.methods = frozenset(method.upper() for method in methods)
+
+    def isRelevant(self, request):
+        return request.method in self.methods
+
+
+@zope.interface.implementer(interfaces.IRequestClassifier)
+class PathPrefixRequestClassifier:
+    """Requests with a path starting with one of the ``prefixes`` are
+    ``relevant``, the other ones are not.
+
+    The path is the ``PATH_INFO`` of the request environment, which cannot
+    be overridden by form variables. Only one lookup is done per distinct
+    prefix length.
+    """
+
+    def __init__(self, prefixes, relevant=False):
+        self.prefixes = frozenset(prefixes)
+        self.lengths = sorted({len(prefix) for prefix in self.prefixes})
+        self.relevant = relevant
+
+    def isRelevant(self, request):
+        path = request.environment.get('PATH_INFO', '')
+        for length in self.lengths:
+            if path[:length] in self.prefixes:
+                return self.relevant
+        return not self.relevant
+
+
+BUILTIN_CLASSIFIERS = {
+    interfaces.TML_CHECK_NONRESOURCE: ResourceRequestClassifier(),
+    interfaces.TML_CHECK_POSTONLY: MethodRequestClassifier(('POST',)),
+}
+
+
+def getClassifier(name):
+    """Return the classifier of a ``failedAttemptCheck`` other than
+    ``TML_CHECK_ALL``."""
+    classifier = BUILTIN_CLASSIFIERS.get(name)
+    if classifier is None:
+        # if we have a utility name, then it must be there
+        classifier = zope.component.getUtility(
+            interfaces.IRequestClassifier, name=name)
+    return classifier
+
+
+def isRelevantRequest(request, name):
+    """Return whether the request is relevant for the ``failedAttemptCheck``
+    ``name``.
+
+    The decision is cached in the annotations of the request, so that the
+    classifier runs only once per request.
+    """
+    annotations = getattr(request, 'annotations', None)
+    if annotations is None:
+        return bool(getClassifier(name).isRelevant(request))
+    cache = annotations.get(ANNOTATION_KEY)
+    if cache is None:
+        cache = annotations[ANNOTATION_KEY] = {}
+    relevant = cache.get(name)
+    if relevant is None:
+        relevant = cache[name] = bool(getClassifier(name).isRelevant(request))
+    return relevant
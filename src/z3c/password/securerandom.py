@@ -0,0 +1,173 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Buffered Cryptographically Secure Random Numbers
+"""
+import functools
+import os
+import random
+import threading
+import weakref
+
+
+# The instances, whose buffers are dropped in forked processes.
+_instances = weakref.WeakSet()
+
+
+def _dropBuffers():
+    for instance in list(_instances):
+        instance._reset()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_dropBuffers)
+
+
+@functools.lru_cache(maxsize=64)
+def _table(alphabet):
+    """The table mapping the latin-1 decoded bytes to the alphabet.
+
+    The bytes beyond the largest multiple of the size of the alphabet are
+    deleted, so that each character is mapped from as many bytes.
+    """
+    size = len(alphabet)
+    limit = 256 - 256 % size
+    table = {byte: alphabet[byte % size] for byte in range(limit)}
+    table.update((byte, None) for byte in range(limit, 256))
+    return table
+
+
+class SecureRandom(random.Random):
+    """Random numbers from ``os.urandom()``, read ``bufferSize`` bytes at
+    a time.
+
+    Like ``random.SystemRandom`` it cannot be seeded and has no state to
+    save or restore. The bytes are buffered, so that many numbers and
+    characters are drawn from a single system call. The methods of
+    ``random.Random`` drawing integers, like ``choice()``, ``randint()`` and
+    ``sample()``, reject the bytes out of range and thus are unbiased.
+
+    The buffer is shared by the threads and dropped in forked processes,
+    so that no bytes are used twice.
+    """
+
+    bufferSize = 4096
+
+    def __init__(self, bufferSize=None):
+        if bufferSize is not None:
+            self.bufferSize = bufferSize
+        self._lock = threading.Lock()
+        self._reset()
+        super().__init__()
+        _instances.add(self)
+
+    def _reset(self):
+        self._buffer = b''
+        self._offset = 0
+
+    def __reduce__(self):
+        return self.__class__, (self.bufferSize,)
+
+    def seed(self, *args, **kwds):
+        """Not used, the numbers cannot be reproduced."""
+        return None
+
+    def getstate(self):
+        raise NotImplementedError('SecureRandom has no state.')
+
+    def setstate(self, state):
+        raise NotImplementedError('SecureRandom has no state.')
+
+    def randbytes(self, n):
+        """Return ``n`` random bytes, from the buffer as long as possible."""
+        with self._lock:
+            offset = self._offset
+            if offset + n > len(self._buffer):
+                self._buffer = os.urandom(max(self.bufferSize, n))
+                offset = 0
+            self._offset = offset + n
+            return self._buffer[offset:offset + n]
+
+    def getrandbits(self, k):
+        if k < 0:
+            raise ValueError('number of bits must be non-negative')
+        if k == 0:
+            return 0
+        size = (k + 7) // 8
+        number = int.from_bytes(self.randbytes(size), 'big')
+        return number >> (size * 8 - k)
+
+    def random(self):
+        return self.getrandbits(53) * 2 ** -53
+
+    def _randbelow(self, n):
+        """Draw an integer below ``n`` from one byte, if ``n`` fits into a
+        byte, rejecting the bytes that would favour the small integers."""
+        if n > 256:
+            return self._randbelow_with_getrandbits(n)
+        limit = 256 - 256 % n
+        while True:
+            byte = self.randbytes(1)[0]
+            if byte < limit:
+                return byte % n
+
+    def shuffle(self, x):
+        """Shuffle the list ``x`` in place, drawing one byte per swap.
+
+        Lists of more than 256 items are shuffled by ``random.Random``.
+        """
+        size = len(x)
+        if size > 256:
+            return super().shuffle(x)
+        data = self.randbytes(size * 2)
+        pos = 0
+        for idx in reversed(range(1, size)):
+            limit = 256 - 256 % (idx + 1)
+            while True:
+                if pos == len(data):
+                    data = self.randbytes(size)
+                    pos = 0
+                byte = data[pos]
+                pos += 1
+                if byte < limit:
+                    break
+            other = byte % (idx + 1)
+            x[idx], x[other] = x[other], x[idx]
+
+    def chars(self, alphabet, count):
+        """Draw ``count`` characters uniformly from the ``alphabet``.
+
+        The characters are mapped from whole buffers of random bytes at
+        once, rejecting the bytes that would favour the first characters.
+        Alphabets of more than 256 characters are drawn with ``choice()``.
+        """
+        if count <= 0:
+            return ''
+        if not alphabet:
+            raise IndexError('Cannot choose from an empty sequence')
+        if len(alphabet) > 256:
+            return ''.join(self.choice(alphabet) for idx in range(count))
+        table = _table(alphabet)
+        result = ''
+        while len(result) < count:
+            # At least half of the bytes are accepted.
+            missing = count - len(result)
+            buffer = self.randbytes(missing * 2 + 8)
+            result += buffer.decode('latin-1').translate(table)
+        return result[:count]
+
+    def stream(self, alphabet, chunk=16):
+        """Iterate over characters drawn uniformly from the ``alphabet``,
+        ``chunk`` characters at a time."""
+        while True:
+            yield from self.chars(alphabet, chunk)
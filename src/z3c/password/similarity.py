@@ -0,0 +1,96 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Password Similarity Implementations
+"""
+import difflib
+
+import zope.interface
+
+from z3c.password import interfaces
+
+
+def _popcount(value):
+    return bin(value).count('1')
+
+
+@zope.interface.implementer(interfaces.IPasswordSimilarity)
+class DifflibSimilarity:
+    """The similarity as computed by ``difflib.SequenceMatcher.ratio()``.
+
+    The cheap upper bounds of the sequence matcher are tried first, so the
+    full ratio is only computed when the passwords might be too similar. The
+    outcome is the same as always computing the full ratio.
+    """
+
+    def ratio(self, new, ref, maxSimilarity=None):
+        '''See interfaces.IPasswordSimilarity'''
+        matcher = difflib.SequenceMatcher(None, new, ref)
+        if maxSimilarity is not None:
+            bound = matcher.real_quick_ratio()
+            if bound <= maxSimilarity:
+                return bound
+            bound = matcher.quick_ratio()
+            if bound <= maxSimilarity:
+                return bound
+        return matcher.ratio()
+
+
+@zope.interface.implementer(interfaces.IPasswordSimilarity)
+class BoundedSimilarity:
+    """The similarity based on the longest common subsequence.
+
+    The ratio is ``2 * L / T``, where ``L`` is the length of the longest
+    common subsequence and ``T`` the total length of both passwords. Since
+    the matching blocks found by ``difflib`` form a common subsequence, this
+    ratio is never lower than the one of ``DifflibSimilarity``.
+
+    The longest common subsequence is computed bit-parallel, processing one
+    character of the longer password per step, so the cost grows linearly
+    with the length for passwords of realistic sizes. The computation stops
+    as soon as the ratio provably does not exceed ``maxSimilarity``.
+    """
+
+    # How many characters are processed between checks of the bound.
+    checkInterval = 16
+
+    def ratio(self, new, ref, maxSimilarity=None):
+        '''See interfaces.IPasswordSimilarity'''
+        total = len(new) + len(ref)
+        if not total:
+            return 1.0
+        short, long = sorted((new, ref), key=len)
+        if maxSimilarity is not None:
+            bound = 2.0 * len(short) / total
+            if bound <= maxSimilarity:
+                return bound
+            # The common subsequence must be longer than this.
+            needed = maxSimilarity * total / 2.0
+
+        masks = {}
+        for idx, char in enumerate(short):
+            masks[char] = masks.get(char, 0) | (1 << idx)
+        full = (1 << len(short)) - 1
+        vector = full
+        for idx, char in enumerate(long, 1):
+            match = vector & masks.get(char, 0)
+            vector = ((vector + match) | (vector - match)) & full
+            if (maxSimilarity is not None
+                    and not idx % self.checkInterval):
+                # Each of the remaining characters can extend the common
+                # subsequence by at most one.
+                common = len(short) - _popcount(vector)
+                bound = min(common + len(long) - idx, len(short))
+                if bound <= needed:
+                    return 2.0 * bound / total
+        return 2.0 * (len(short) - _popcount(vector)) / total
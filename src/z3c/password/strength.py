@@ -0,0 +1,364 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Password Strength Estimation
+"""
+import functools
+import itertools
+import math
+import string
+
+import zope.interface
+
+from z3c.password import interfaces
+
+
+# The keyboard layouts, one row per line, with the unshifted and shifted
+# character of each key. A row is offset by half a key to the one above.
+QWERTY = r"""
+`~ 1! 2@ 3# 4$ 5% 6^ 7& 8* 9( 0) -_ =+
+qQ wW eE rR tT yY uU iI oO pP [{ ]} \|
+aA sS dD fF gG hH jJ kK lL ;: '"
+zZ xX cC vV bB nN mM ,< .> /?
+"""
+
+# The keypad, whose rows are aligned.
+KEYPAD = """
+/ * -
+7 8 9 +
+4 5 6
+1 2 3
+0 .
+"""
+
+# The offsets of the rows and columns of the neighbours of a key, in the
+# order of their direction, for slanted and aligned rows.
+SLANTED = ((0, -1), (-1, 0), (-1, 1), (0, 1), (1, 0), (1, -1))
+ALIGNED = ((0, -1), (-1, -1), (-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0),
+           (1, -1))
+
+# Characters commonly substituted for letters.
+L33T = str.maketrans({
+    '4': 'a', '@': 'a', '8': 'b', '(': 'c', '{': 'c', '3': 'e', '6': 'g',
+    '9': 'g', '1': 'i', '!': 'i', '|': 'l', '0': 'o', '$': 's', '5': 's',
+    '7': 't', '+': 't', '%': 'x', '2': 'z'})
+
+# Common first characters of sequences.
+_SEQUENCE_STARTS = frozenset('aAzZ019')
+
+_YEARS = range(1900, 2100)
+
+
+def _bits(guesses):
+    return math.log2(guesses) if guesses > 1 else 0.0
+
+
+@functools.lru_cache(maxsize=None)
+def _choices(total, count):
+    # the bits to tell which ``count`` of ``total`` positions are special
+    count = min(count, total - count)
+    return _bits(sum(math.comb(total, idx) for idx in range(count + 1)))
+
+
+def compileGraph(layout, directions):
+    """Compile a keyboard layout into an adjacency graph.
+
+    The graph maps each character to a dictionary of its neighbours and
+    their direction. Returns the graph, the shifted characters, the bits to
+    pick the start of a walk and the bits to pick the next key when turning.
+    """
+    keys = {}
+    for row, line in enumerate(layout.strip().splitlines()):
+        for column, key in enumerate(line.split()):
+            keys[row, column] = key
+    graph = {}
+    for (row, column), key in keys.items():
+        neighbours = {}
+        for direction, (dr, dc) in enumerate(directions):
+            for char in keys.get((row + dr, column + dc), ''):
+                neighbours[char] = direction
+        for char in key:
+            graph[char] = neighbours
+    shifted = frozenset(key[1:] for key in keys.values() if key[1:])
+    degree = sum(len(n) for n in graph.values()) / len(graph)
+    return graph, shifted, _bits(len(keys)), _bits(degree)
+
+
+class StrengthTables:
+    """The compiled tables of the strength estimation."""
+
+    def __init__(self, dictionaries, graphs):
+        self.ranks = {}
+        for words in dictionaries:
+            for rank, word in enumerate(words.split(), 1):
+                if rank < self.ranks.get(word, rank + 1):
+                    self.ranks[word] = rank
+        self.reversedRanks = {
+            word[::-1]: rank for word, rank in self.ranks.items()}
+        # All beginnings of words, to stop looking for longer words early.
+        self.prefixes = frozenset(
+            word[:end]
+            for word in itertools.chain(self.ranks, self.reversedRanks)
+            for end in range(1, len(word) + 1))
+        self.graphs = graphs
+
+
+def defaultTables():
+    """Compile the tables of the built-in frequency lists and keyboards."""
+    from z3c.password import frequencies
+    return StrengthTables(
+        (frequencies.PASSWORDS, frequencies.WORDS),
+        (compileGraph(QWERTY, SLANTED), compileGraph(KEYPAD, ALIGNED)))
+
+
+# The default tables, shared by all estimators.
+_default = None
+
+
+def _defaultTables():
+    global _default
+    if _default is None:
+        _default = defaultTables()
+    return _default
+
+
+@zope.interface.implementer(interfaces.IPasswordStrength)
+class PatternStrength:
+    """The strength estimated from the patterns found in the password.
+
+    Like zxcvbn, the password is split into the sequence of dictionary words,
+    keyboard walks, sequences, repeats and years that is the cheapest to
+    guess, and the bits needed to guess each part are summed up. Characters
+    that are not part of a pattern cost the bits of their character group.
+
+    The word lists and keyboard graphs are given as ``StrengthTables``. The
+    default ones of ``defaultTables()`` are compiled when the first password
+    is estimated, once for all estimators.
+    """
+
+    # Only the patterns of the first characters are searched, the others
+    # cost the bits of their group.
+    maxLength = 100
+
+    # The bits of a character that is not part of a pattern, by group.
+    groupBits = (
+        (string.ascii_lowercase, _bits(26)),
+        (string.ascii_uppercase, _bits(26)),
+        (string.digits, _bits(10)),
+        (string.punctuation + ' ', _bits(33)),
+    )
+    otherBits = _bits(100)
+
+    def __init__(self, tables=None):
+        self._tables = tables
+        self._charBits = {
+            char: bits for chars, bits in self.groupBits for char in chars}
+
+    def __getstate__(self):
+        # the default tables are compiled again instead of being pickled
+        state = self.__dict__.copy()
+        if state['_tables'] is _default:
+            state['_tables'] = None
+        return state
+
+    @property
+    def tables(self):
+        tables = self._tables
+        if tables is None:
+            tables = self._tables = _defaultTables()
+        return tables
+
+    def entropy(self, new):
+        '''See interfaces.IPasswordStrength'''
+        rest = new[self.maxLength:]
+        return self._entropy(new[:self.maxLength], {}) + sum(
+            self._charBits.get(char, self.otherBits) for char in rest)
+
+    def _entropy(self, new, units):
+        # The patterns found are stored as ``(end, bits)`` by their start.
+        # The bits of repeated units are kept in ``units``.
+        matches = [[] for char in new]
+        tables = self.tables
+        self._words(new, tables, matches)
+        for graph in tables.graphs:
+            self._walks(new, graph, matches)
+        self._sequences(new, matches)
+        self._repeats(new, units, matches)
+        self._years(new, matches)
+        # best[j] holds the fewest bits to guess the first j characters.
+        best = [0.0] + [math.inf] * len(new)
+        charBits = self._charBits
+        otherBits = self.otherBits
+        for start, char in enumerate(new):
+            base = best[start]
+            bits = base + charBits.get(char, otherBits)
+            if bits < best[start + 1]:
+                best[start + 1] = bits
+            for end, bits in matches[start]:
+                bits += base
+                if bits < best[end]:
+                    best[end] = bits
+        return best[-1]
+
+    def _words(self, new, tables, matches):
+        ranks = tables.ranks
+        reversedRanks = tables.reversedRanks
+        prefixes = tables.prefixes
+        lower = new.lower()
+        plain = lower.translate(L33T)
+        length = len(new)
+        for start in range(length):
+            for end in range(start + 1, length + 1):
+                word = lower[start:end]
+                unleet = plain[start:end]
+                if word not in prefixes and unleet not in prefixes:
+                    break
+                if end - start < 3:
+                    continue
+                extra = 0.0
+                rank = ranks.get(word)
+                if rank is None:
+                    rank = reversedRanks.get(word)
+                    extra = 1.0
+                if rank is None:
+                    if unleet == word:
+                        continue
+                    rank = ranks.get(unleet)
+                    if rank is None:
+                        continue
+                    substituted = sum(a != b for a, b in zip(unleet, word))
+                    extra = _choices(len(word), substituted)
+                token = new[start:end]
+                if token != word:
+                    extra += self._caseBits(token)
+                matches[start].append((end, _bits(rank + 1) + extra))
+
+    def _caseBits(self, token):
+        if not any(char.isupper() for char in token):
+            return 0.0
+        if (token.isupper() or token[0].isupper() and token[1:].islower()
+                or token[-1].isupper() and token[:-1].islower()):
+            return 1.0
+        letters = [char for char in token if char.isalpha()]
+        upper = sum(char.isupper() for char in letters)
+        return _choices(len(letters), upper)
+
+    def _walks(self, new, graph, matches):
+        # Only the walk up to the end of the run of adjacent keys is matched
+        # from each start, so that a walk takes linear time.
+        graph, shiftedKeys, startBits, turnBits = graph
+        length = len(new)
+        # steps[i] is the direction from the key before to the one at i,
+        # turns[i] the changes of direction and shifted[i] the shifted keys
+        # up to i.
+        steps = [None] * length
+        turns = [0] * length
+        shifted = [0] * length
+        for idx in range(1, length):
+            step = steps[idx] = graph.get(new[idx - 1], {}).get(new[idx])
+            turns[idx] = turns[idx - 1] + (
+                step is not None and step != steps[idx - 1])
+            shifted[idx] = shifted[idx - 1] + (new[idx] in shiftedKeys)
+        last = length - 1
+        for start in range(length - 2, -1, -1):
+            if steps[start + 1] is None:
+                last = start
+                continue
+            size = last + 1 - start
+            if size < 3:
+                continue
+            # the first step counts as a turn
+            count = 1 + turns[last] - turns[start + 1]
+            matches[start].append(
+                (last + 1, startBits + count * turnBits + _bits(size)
+                 + _choices(size, shifted[last] - shifted[start])))
+
+    def _sequences(self, new, matches):
+        # Only the sequence up to the end of its run is matched from each
+        # start, so that a sequence takes linear time.
+        length = len(new)
+        start = 0
+        while start < length - 2:
+            delta = ord(new[start + 1]) - ord(new[start])
+            if delta not in (1, -1):
+                start += 1
+                continue
+            end = start + 2
+            while end < length and ord(new[end]) - ord(new[end - 1]) \
+                    == delta:
+                end += 1
+            for first in range(start, end - 2):
+                char = new[first]
+                base = 2.0 if char in _SEQUENCE_STARTS else (
+                    _bits(10) if char.isdigit() else _bits(26))
+                if delta < 0:
+                    base += 1.0
+                matches[first].append((end, base + _bits(end - first)))
+            # the last character may start a sequence in the other direction
+            start = end - 1
+
+    def _repeats(self, new, units, matches):
+        length = len(new)
+        # The end of the last run of a unit of each size and the bits of its
+        # unit. The units starting within the run are rotations of its unit,
+        # which are not matched again when they do not repeat beyond its end
+        # and cost the same bits otherwise.
+        runs = {}
+        # The unit size and the end of the run reaching furthest. Within it
+        # units of at least that size are rotations of its unit or repeats
+        # of shorter units, which are skipped at once.
+        runSize = runEnd = 0
+        for start, first in enumerate(new):
+            # A unit repeated from ``start`` ends before the next occurrence
+            # of its first character.
+            limit = (length + start) // 2 + 1
+            pos = new.find(first, start + 1, limit)
+            while pos != -1:
+                size = pos - start
+                if size >= runSize and start + 2 * size <= runEnd:
+                    pos = new.find(first, (start + runEnd) // 2 + 1, limit)
+                    continue
+                pos = new.find(first, pos + 1, limit)
+                previous = runs.get(size)
+                if previous is not None and start + 2 * size <= previous[0]:
+                    continue
+                unit = new[start:start + size]
+                if not new.startswith(unit, start + size):
+                    continue
+                if (unit + unit).find(unit, 1) < size:
+                    # a repeat of a shorter unit, which is matched already
+                    continue
+                end = start + 2 * size
+                while new.startswith(unit, end):
+                    end += size
+                if end > runEnd:
+                    runSize, runEnd = size, end
+                if previous is not None and start + size <= previous[0]:
+                    bits = previous[1]
+                else:
+                    bits = units.get(unit)
+                    if bits is None:
+                        bits = units[unit] = self._entropy(unit, units)
+                runs[size] = (end, bits)
+                matches[start].append(
+                    (end, bits + _bits((end - start) // size)))
+                # Longer units repeated within the run are repeats of this
+                # one.
+                if pos != -1 and pos <= (start + end) // 2:
+                    pos = new.find(first, (start + end) // 2 + 1, limit)
+
+    def _years(self, new, matches):
+        for start in range(len(new) - 3):
+            year = new[start:start + 4]
+            if year.isdigit() and int(year) in _YEARS:
+                matches[start].append((start + 4, _bits(len(_YEARS))))
@@ -37,10 +37,14 @@ def tearDown(test):
 class TestBrowserRequest():
     """pretty dumb test request"""
 
-    def __init__(self, url, method='GET'):
+    def __init__(self, url, method='GET', path=None):
         self.URL = url
         self.method = method
         self.interaction = None
+        self.annotations = {}
+        self.environment = {}
+        if path is not None:
+            self.environment['PATH_INFO'] = path
 
     def getURL(self):
         return self.URL
@@ -28,7 +28,34 @@ def test_suite():
         DocFileSuite('README.txt',
                      setUp=testing.setUp, tearDown=testing.tearDown,
                      optionflags=flags),
+        DocFileSuite('blocklist.txt',
+                     setUp=testing.setUp, tearDown=testing.tearDown,
+                     optionflags=flags),
+        DocFileSuite('composite.txt',
+                     setUp=testing.setUp, tearDown=testing.tearDown,
+                     optionflags=flags),
+        DocFileSuite('securerandom.txt',
+                     setUp=testing.setUp, tearDown=testing.tearDown,
+                     optionflags=flags),
         DocFileSuite('principal.txt',
                      setUp=testing.setUp, tearDown=testing.tearDown,
                      optionflags=flags),
+        DocFileSuite('compact.txt',
+                     setUp=testing.setUp, tearDown=testing.tearDown,
+                     optionflags=flags),
+        DocFileSuite('loginfailures.txt',
+                     setUp=testing.setUp, tearDown=testing.tearDown,
+                     optionflags=flags),
+        DocFileSuite('credentials.txt',
+                     setUp=testing.setUp, tearDown=testing.tearDown,
+                     optionflags=flags),
+        DocFileSuite('monitor.txt',
+                     setUp=testing.setUp, tearDown=testing.tearDown,
+                     optionflags=flags),
+        DocFileSuite('aio.txt',
+                     setUp=testing.setUp, tearDown=testing.tearDown,
+                     optionflags=flags),
+        DocFileSuite('audit.txt',
+                     setUp=testing.setUp, tearDown=testing.tearDown,
+                     optionflags=flags),
     ))